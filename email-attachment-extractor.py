@@ -12,10 +12,9 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Direkte Imports ohne relative Pfade
 from src.cli.argparser import parse_arguments, validate_arguments
-from src.cli.interactive import interactive_setup, get_save_path_interactive
-from src.utils.config_loader import prepare_config
+from src.cli.interactive import interactive_setup, get_save_path_interactive, default_save_path
+from src.utils.config_loader import ConfigLoader, KEYRING_SERVICE, prepare_config
 from src.utils.colors import Colors
-from src.core.extractor import EmailAttachmentExtractor
 from src.utils.debug import enable_debug, dprint, dump_config
 
 def main():
@@ -30,7 +29,8 @@ def main():
         try:
             log_path = os.path.expanduser(path)
             os.makedirs(os.path.dirname(log_path) or '.', exist_ok=True)
-            log_fh = open(log_path, 'a', encoding='utf-8')
+            # Large buffer: progress output arrives in many small fragments
+            log_fh = open(log_path, 'a', encoding='utf-8', buffering=64 * 1024)
 
             class _TeeStream:
                 def __init__(self, original, fh):
@@ -40,11 +40,9 @@ def main():
 
                 def write(self, s):
                     self._orig.write(s)
-                    try:
-                        from src.utils.colors import Colors as _C
-                        self._fh.write(_C.strip_colors(s))
-                    except Exception:
-                        self._fh.write(s)
+                    if '\x1b' in s:
+                        s = Colors.strip_colors(s)
+                    self._fh.write(s)
 
                 def flush(self):
                     try:
@@ -101,12 +99,19 @@ def main():
     
     # Get save path if not specified
     if not config.get('save_path'):
-        config['save_path'] = get_save_path_interactive()
+        if sys.stdin.isatty():
+            config['save_path'] = get_save_path_interactive()
+        else:
+            # Nobody to answer the menu (cron, pipes); skip the drive scan
+            config['save_path'] = default_save_path()
+            print(Colors.info(f"No save path configured; using {config['save_path']}"))
         if not config['save_path']:
             print(Colors.warning("No save path selected"))
             sys.exit(0)
     
-    # Initialize extractor
+    # Initialize extractor (imported here: pulls in imaplib, ssl and the
+    # email package, which --help and argument errors never need)
+    from src.core.extractor import EmailAttachmentExtractor
     extractor = EmailAttachmentExtractor(
         server=config['server'],
         port=config['port'],
@@ -121,22 +126,41 @@ def main():
     print("="*60)
     
     if not extractor.connect():
+        if ConfigLoader.password_source == 'keyring':
+            print(Colors.warning(
+                f"The password came from the system keyring; remove it with "
+                f"'keyring del {KEYRING_SERVICE} {config['username']}' to be asked again"
+            ))
         sys.exit(1)
+    ConfigLoader.remember_password(config)
+    
+    # Options shared by the single-mailbox and the recursive run
+    run_options = dict(
+        save_path=config['save_path'],
+        search_criteria=config.get('search_criteria', 'ALL'),
+        organize_by_sender=config.get('organize_by_sender', False),
+        organize_by_date=config.get('organize_by_date', True),
+        save_metadata=config.get('save_metadata', True),
+        allowed_extensions=config.get('allowed_extensions'),
+        excluded_extensions=config.get('excluded_extensions'),
+        attachments_only=config.get('attachments_only', False),
+        json_pretty=config.get('json_pretty', False),
+        parse_workers=config.get('parse_workers') or 1,
+        deduplicate=config.get('deduplicate', False),
+        bulk_size=config.get('bulk_size'),
+        incremental=config.get('incremental', False)
+    )
     
     try:
         # Process emails
         if config.get('recursive'):
             dprint("Recursive processing enabled for INBOX subfolders", tag="RUN")
             stats = extractor.process_all_inbox_folders(
-                save_path=config['save_path'],
-                search_criteria=config.get('search_criteria', 'ALL'),
-                organize_by_sender=config.get('organize_by_sender', False),
-                organize_by_date=config.get('organize_by_date', True),
                 limit_per_folder=config.get('limit_per_folder'),
                 total_limit=config.get('total_limit') or config.get('limit'),
-                save_metadata=config.get('save_metadata', True),
-                allowed_extensions=config.get('allowed_extensions'),
-                excluded_extensions=config.get('excluded_extensions')
+                folder_workers=config.get('folder_workers') or 1,
+                subscribed_only=config.get('subscribed_only', False),
+                **run_options
             )
         else:
             # Process single mailbox
@@ -148,16 +172,7 @@ def main():
                 f"Processing mailbox='{config.get('mailbox', 'INBOX')}', search='{config.get('search_criteria', 'ALL')}', limit={config.get('limit')}",
                 tag="RUN",
             )
-            stats = extractor.process_emails(
-                save_path=config['save_path'],
-                search_criteria=config.get('search_criteria', 'ALL'),
-                organize_by_sender=config.get('organize_by_sender', False),
-                organize_by_date=config.get('organize_by_date', True),
-                limit=config.get('limit'),
-                save_metadata=config.get('save_metadata', True),
-                allowed_extensions=config.get('allowed_extensions'),
-                excluded_extensions=config.get('excluded_extensions')
-            )
+            stats = extractor.process_emails(limit=config.get('limit'), **run_options)
         
         # Print statistics
         extractor.print_statistics()
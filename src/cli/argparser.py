@@ -85,11 +85,39 @@ Examples:
         metavar='CRITERIA',
         help='IMAP search criteria (default: ALL)'
     )
+    mailbox_group.add_argument(
+        '--attachments-only',
+        action='store_true',
+        help='Let the server search only for emails with attachments'
+    )
     mailbox_group.add_argument(
         '--recursive',
         action='store_true',
         help='Process all INBOX subfolders recursively'
     )
+    mailbox_group.add_argument(
+        '--subscribed-only',
+        action='store_true',
+        help='With --recursive, only process subscribed subfolders'
+    )
+    mailbox_group.add_argument(
+        '--folder-workers',
+        type=int,
+        metavar='N',
+        help='Parallel IMAP connections for --recursive (default: 1, max: 4)'
+    )
+    mailbox_group.add_argument(
+        '--parse-workers',
+        type=int,
+        metavar='N',
+        help='Processes for parsing emails and saving attachments (default: 1)'
+    )
+    mailbox_group.add_argument(
+        '--bulk-size',
+        type=int,
+        metavar='N',
+        help='Messages requested per IMAP FETCH command (default: 100, max: 500)'
+    )
     
     # Output settings
     output_group = parser.add_argument_group('Output Settings')
@@ -112,6 +140,22 @@ Examples:
         action='store_true',
         help='Do not save metadata JSON files'
     )
+    output_group.add_argument(
+        '--json-pretty',
+        action='store_true',
+        help='Write one indented metadata JSON per mailbox instead of appending JSON lines'
+    )
+    output_group.add_argument(
+        '--dedup',
+        action='store_true',
+        dest='deduplicate',
+        help='Hard-link attachments identical to ones already saved in this run'
+    )
+    output_group.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Skip emails extracted by earlier runs into the same save path'
+    )
     
     # Processing limits
     limit_group = parser.add_argument_group('Processing Limits')
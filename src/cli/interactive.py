@@ -352,6 +352,18 @@ def confirm_settings(config: Dict) -> bool:
     return confirm == 'y'
 
 
+def default_save_path() -> str:
+    """
+    Build the default save path: a timestamped folder in the current directory.
+    
+    Returns:
+        Path like ./email_attachments_20240115_093000
+    """
+    from datetime import datetime
+    dirname = f"email_attachments_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    return os.path.join(os.getcwd(), dirname)
+
+
 def get_save_path_interactive() -> Optional[str]:
     """
     Get save path interactively.
@@ -368,9 +380,7 @@ def get_save_path_interactive() -> Optional[str]:
     choice = input(Colors.cyan("Select option (1-3): ")).strip()
     
     if choice == '1':
-        from datetime import datetime
-        dirname = f"email_attachments_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        return os.path.join(os.getcwd(), dirname)
+        return default_save_path()
         
     elif choice == '2':
         from ..utils.filesystem import get_available_drives
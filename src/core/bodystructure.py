@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+IMAP BODYSTRUCTURE Module
+
+Parses FETCH (BODYSTRUCTURE) responses so messages without attachments
+can be recognized before their full body is downloaded.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+
+# Leading message number of a FETCH response, e.g. b'12 (BODYSTRUCTURE ...'
+_RESPONSE_START_RE = re.compile(rb'^\d+ \(')
+
+# Delimiters ending an atom in an IMAP response
+_ATOM_END = b' ()"{\r\n'
+
+Node = Union[None, str, List['Node']]
+
+
+class BodyStructureError(ValueError):
+    """Raised when a BODYSTRUCTURE response cannot be parsed."""
+
+
+def _tokenize_list(data: bytes, pos: int) -> Tuple[List[Node], int]:
+    """Parse a parenthesized list starting right after '(' at pos."""
+    items: List[Node] = []
+    length = len(data)
+
+    while pos < length:
+        ch = data[pos:pos + 1]
+
+        if ch in (b' ', b'\r', b'\n'):
+            pos += 1
+        elif ch == b'(':
+            sub, pos = _tokenize_list(data, pos + 1)
+            items.append(sub)
+        elif ch == b')':
+            return items, pos + 1
+        elif ch == b'"':
+            # Quoted string with backslash escapes
+            out = bytearray()
+            pos += 1
+            while pos < length and data[pos:pos + 1] != b'"':
+                if data[pos:pos + 1] == b'\\':
+                    pos += 1
+                out += data[pos:pos + 1]
+                pos += 1
+            if pos >= length:
+                raise BodyStructureError("Unterminated quoted string")
+            items.append(out.decode('utf-8', errors='replace'))
+            pos += 1
+        elif ch == b'{':
+            # Literal: {n}\r\n followed by n bytes
+            end = data.find(b'}', pos)
+            if end < 0:
+                raise BodyStructureError("Malformed literal")
+            size = int(data[pos + 1:end])
+            start = end + 1
+            if data[start:start + 2] == b'\r\n':
+                start += 2
+            items.append(data[start:start + size].decode('utf-8', errors='replace'))
+            pos = start + size
+        else:
+            start = pos
+            while pos < length and data[pos:pos + 1] not in _ATOM_END:
+                pos += 1
+            atom = data[start:pos].decode('ascii', errors='replace')
+            items.append(None if atom.upper() == 'NIL' else atom)
+
+    raise BodyStructureError("Unbalanced parentheses")
+
+
+def parse_fetch_response(data: List) -> Dict[str, Node]:
+    """
+    Extract BODYSTRUCTUREs from an imaplib FETCH response.
+
+    imaplib returns plain bytes for responses without literals and
+    ``(prefix, literal)`` tuples followed by the remaining bytes otherwise;
+    these pieces are joined back into wire format before parsing.
+    Responses that cannot be parsed are left out.
+
+    Args:
+        data: Response data as returned by ``IMAP4.fetch``
+
+    Returns:
+        Mapping of message id to parsed body structure
+    """
+    responses: List[bytearray] = []
+    for item in data:
+        if isinstance(item, tuple) and len(item) >= 2:
+            prefix, literal = item[0], item[1]
+            if _RESPONSE_START_RE.match(prefix) or not responses:
+                responses.append(bytearray())
+            responses[-1] += prefix + b'\r\n' + literal
+        elif isinstance(item, (bytes, bytearray)):
+            if _RESPONSE_START_RE.match(item) or not responses:
+                responses.append(bytearray())
+            responses[-1] += item
+
+    structures: Dict[str, Node] = {}
+    for raw in responses:
+        raw = bytes(raw)
+        msg_id, _, rest = raw.partition(b' ')
+        try:
+            if not rest.startswith(b'('):
+                continue
+            items, _ = _tokenize_list(rest, 1)
+        except (BodyStructureError, ValueError):
+            continue
+
+        # items is a flat key/value list: [b'UID', '5', 'BODYSTRUCTURE', [...]]
+        for key, value in zip(items[::2], items[1::2]):
+            if isinstance(key, str) and key.upper() == 'BODYSTRUCTURE':
+                structures[msg_id.decode('ascii', errors='ignore')] = value
+                break
+
+    return structures
+
+
+def _has_filename_param(params: Node) -> bool:
+    """Check a parameter list for name/filename (including RFC 2231 forms)."""
+    if not isinstance(params, list):
+        return False
+    for key in params[::2]:
+        if isinstance(key, str):
+            key = key.lower()
+            if key.startswith('filename') or key.startswith('name'):
+                return True
+    return False
+
+
+def _plain_filename(disposition_params: Node, type_params: Node) -> Optional[str]:
+    """
+    Find the file name Message.get_filename() would report for a part.
+
+    Returns None when the name cannot be known from the structure alone:
+    no name at all, or a name in RFC 2231 form (filename*=, filename*0*=)
+    that the full parse decodes.
+    """
+    for params, key in ((disposition_params, 'filename'), (type_params, 'name')):
+        if not isinstance(params, list):
+            continue
+        found = None
+        for name, value in zip(params[::2], params[1::2]):
+            if not isinstance(name, str):
+                continue
+            name = name.lower()
+            if name == key:
+                found = value
+            elif name.startswith(key + '*'):
+                return None
+        if found is not None:
+            return found if isinstance(found, str) else None
+    return None
+
+
+def may_have_attachments(
+    structure: Node,
+    accept: Optional[Callable[[str], bool]] = None
+) -> bool:
+    """
+    Decide whether a message may contain attachments.
+
+    Mirrors EmailProcessor._is_attachment: a part counts as an attachment
+    when its disposition is 'attachment' or it carries a file name. The
+    check is conservative; when the structure is incomplete or unexpected
+    the message is assumed to have attachments so it still gets fetched.
+
+    Args:
+        structure: Parsed BODYSTRUCTURE
+        accept: Optional file name filter; attachments whose plain file
+            name it rejects do not count
+
+    Returns:
+        False only if the message definitely has no (accepted) attachments
+    """
+    if not isinstance(structure, list) or not structure:
+        return True
+
+    # Multipart: child structures come first, followed by the subtype
+    if isinstance(structure[0], list):
+        children = []
+        for child in structure:
+            if not isinstance(child, list):
+                break
+            children.append(child)
+        return any(may_have_attachments(child, accept) for child in children)
+
+    if len(structure) < 7 or not isinstance(structure[0], str):
+        return True
+
+    maintype = structure[0].lower()
+    subtype = (structure[1] or '').lower() if isinstance(structure[1], str) else ''
+
+    named = _has_filename_param(structure[2])
+    if named and accept is None:
+        return True
+
+    # Extension data (md5, disposition, ...) follows the type-specific fields
+    if maintype == 'text':
+        disposition_index = 9
+    elif maintype == 'message' and subtype == 'rfc822':
+        # msg.walk() descends into attached messages, so check them too
+        if len(structure) > 8 and may_have_attachments(structure[8], accept):
+            return True
+        disposition_index = 11
+    else:
+        disposition_index = 8
+
+    if len(structure) <= disposition_index:
+        # Server sent no extension data; cannot rule out an attachment
+        return True
+
+    disposition = structure[disposition_index]
+    disposition_params = None
+    if disposition is None:
+        is_attachment = named
+    elif not isinstance(disposition, list) or not disposition:
+        return True
+    else:
+        if len(disposition) > 1:
+            disposition_params = disposition[1]
+        is_attachment = (
+            named
+            or (isinstance(disposition[0], str) and disposition[0].lower() == 'attachment')
+            or _has_filename_param(disposition_params)
+        )
+
+    if not is_attachment or accept is None:
+        return is_attachment
+    filename = _plain_filename(disposition_params, structure[2])
+    return filename is None or accept(filename)
+
+
+def messages_with_attachments(
+    data: List,
+    email_ids: List[str],
+    accept: Optional[Callable[[str], bool]] = None
+) -> Optional[List[str]]:
+    """
+    Filter message ids down to those that may have attachments.
+
+    Args:
+        data: FETCH (BODYSTRUCTURE) response data
+        email_ids: Ids the FETCH was issued for
+        accept: Optional file name filter passed to may_have_attachments
+
+    Returns:
+        Ids to download (ids missing from the response are kept), or None
+        if nothing in the response could be parsed
+    """
+    structures = parse_fetch_response(data)
+    if not structures:
+        return None
+    return [
+        eid for eid in email_ids
+        if eid not in structures or may_have_attachments(structures[eid], accept)
+    ]
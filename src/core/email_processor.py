@@ -6,21 +6,99 @@ Email Processor Module
 Handles email parsing, attachment extraction, and email metadata processing.
 """
 
+import base64
+import binascii
 import email
+import functools
+import hashlib
+import io
 from email import policy
-from email.header import decode_header
+from email.parser import BytesHeaderParser
+from email.header import Header, decode_header
 import os
 import re
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 import email.utils
 
 from ..utils.colors import Colors
 from ..utils.debug import dprint
-from ..utils.filesystem import sanitize_filename, get_unique_filename, create_directory
+from ..utils.filesystem import (
+    sanitize_filename,
+    get_unique_filename,
+    get_existing_filenames,
+    create_directory
+)
 from .pattern_matcher import PatternMatcher
 
+try:
+    # Optional SIMD-accelerated decoder with the same API as base64
+    import pybase64 as _base64
+except ImportError:
+    _base64 = base64
+
+
+# Transfer encodings whose payload already is the attachment content
+IDENTITY_TRANSFER_ENCODINGS = frozenset(('', '7bit', '8bit', 'binary'))
+
+# Encoded characters decoded per write when streaming base64 attachments.
+# Multiple of 4 so that every full slice decodes on its own.
+ATTACHMENT_CHUNK_SIZE = 64 * 1024
+
+# Largest buffer of attachment files; fewer write syscalls for large parts.
+# Smaller parts get a buffer sized to their payload (see _write_buffer_size).
+ATTACHMENT_WRITE_BUFFER = 1 << 20
+
+# Characters kept when shortening a Message-ID for folder names
+_MESSAGE_ID_CLEAN_RE = re.compile(r'[^a-zA-Z0-9\-_]')
+
+# Address part of a "Name <email@domain.com>" sender
+_SENDER_ADDRESS_RE = re.compile(r'<([^>]+)>')
+
+# Line break of a folded header line (RFC 5322 unfolding removes the CRLF)
+_HEADER_FOLD_RE = re.compile(r'\r?\n(?=[ \t])')
+
+# Anything _is_attachment could act on: a (file)name parameter (including
+# RFC 2231 forms) or an attachment disposition somewhere in the raw message
+_ATTACHMENT_HINT_RE = re.compile(
+    rb';\s*(?:file)?name\*?[0-9]*\*?\s*=|content-disposition:\s*attachment',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_encoded_words(s: str) -> str:
+    """
+    Decode RFC 2047 encoded words in an unfolded header value.
+    
+    Memoized because the same From headers (and often subjects of a
+    thread) recur across a mailbox. The value is parsed as unstructured
+    text, which keeps backslashes and non-ASCII characters in the plain
+    chunks intact.
+    """
+    return str(policy.default.header_fetch_parse('Subject', s))
+
+
+class _ContentDigest:
+    """SHA-256 of the bytes written for an attachment; restarts if the write is redone."""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self._hash = hashlib.sha256()
+    
+    def update(self, data: bytes):
+        self._hash.update(data)
+    
+    def digest(self) -> bytes:
+        return self._hash.digest()
+    
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
 
 class EmailProcessor:
     """
@@ -30,36 +108,55 @@ class EmailProcessor:
     and organization of saved files.
     """
     
+    # Attachments smaller than this are never hard-linked by --dedup; the
+    # extra remove/link calls cost more than the few blocks they save
+    DEDUP_MIN_SIZE = 64 * 1024
+    
     def __init__(self):
         """Initialize the EmailProcessor."""
         self.current_email_info = {}
-        
-    def parse_email(self, raw_email: bytes, server: str = "") -> email.message.Message:
+        # (base_path, sender, date) -> parent directory of the email folders
+        self._parent_dir_cache: Dict[Tuple[str, str, str], str] = {}
+        # Target directories already created during this run
+        self._created_dirs: Set[str] = set()
+        # (sha256 digest, size) -> first saved copy, for --dedup
+        self._dedup_index: Dict[Tuple[bytes, int], str] = {}
+        # Stands in for the date of undated emails, so they share one folder
+        self._run_started = datetime.now()
+        # (allowed, excluded) patterns last printed by _collect_attachments
+        self._logged_patterns: Optional[Tuple] = None
+        # Attachments of the current email that could not be written
+        self.save_errors: List[str] = []
+        
+    def parse_email(
+        self,
+        raw_email: bytes,
+        server: str = "",
+        headers_only_if_plain: bool = False
+    ) -> email.message.Message:
         """
         Parse raw email bytes into a Message object.
         
+        Uses the compat32 policy: header values stay plain strings and are
+        decoded on demand by `_decode_mime_string`, which is several times
+        faster than building policy.default header objects for every part.
+        Undecodable bytes never make the parser fail (they are kept as
+        surrogate escapes), so all servers share this single path.
+        
         Args:
             raw_email: Raw email data as bytes
-            server: Server name for special handling (e.g., iCloud)
+            server: Server name (no longer used; kept for callers)
+            headers_only_if_plain: Parse only the headers when the raw bytes
+                contain no file name or attachment disposition; the body is
+                then kept as an unparsed string payload
             
         Returns:
             Parsed email Message object
         """
-        # Special handling for iCloud
-        if 'imap.mail.me.com' in server:
-            try:
-                # Try UTF-8 first
-                msg = email.message_from_bytes(raw_email)
-            except:
-                # Fallback to Latin-1
-                msg = email.message_from_string(
-                    raw_email.decode('latin-1', errors='replace')
-                )
-        else:
-            # Standard parsing with policy
-            msg = email.message_from_bytes(raw_email, policy=policy.default)
-            
-        return msg
+        if headers_only_if_plain and not _ATTACHMENT_HINT_RE.search(raw_email):
+            return BytesHeaderParser(policy=policy.compat32).parsebytes(raw_email)
+        
+        return email.message_from_bytes(raw_email, policy=policy.compat32)
     
     def extract_attachments(
         self,
@@ -70,7 +167,8 @@ class EmailProcessor:
         organize_by_date: bool = False,
         allowed_extensions: Optional[List[str]] = None,
         excluded_extensions: Optional[List[str]] = None,
-        pattern_matcher: Optional[PatternMatcher] = None
+        pattern_matcher: Optional[PatternMatcher] = None,
+        deduplicate: bool = False
     ) -> List[Dict]:
         """
         Extract and save attachments from an email message.
@@ -80,6 +178,10 @@ class EmailProcessor:
         - A numeric prefix (01_, 02_, ...) is added to preserve order.
         - Existing files are not overwritten; a unique name is chosen.
         - Allowed/excluded patterns are applied via PatternMatcher.
+        - With ``deduplicate``, an attachment identical to one saved earlier
+          in this run becomes a hard link to that file.
+        - Attachments that could not be written are left out of the result;
+          their error messages are in ``save_errors``.
         
         Args:
             email_id: Unique identifier for the email (for metadata)
@@ -90,6 +192,7 @@ class EmailProcessor:
             allowed_extensions: List of allowed file patterns
             excluded_extensions: List of excluded file patterns
             pattern_matcher: PatternMatcher instance for filtering
+            deduplicate: Hard-link identical attachments instead of storing copies
             
         Returns:
             List of dictionaries containing attachment information
@@ -98,6 +201,7 @@ class EmailProcessor:
             pattern_matcher = PatternMatcher()
             
         saved_attachments: List[Dict] = []
+        self.save_errors = []
         
         # Extract email metadata
         email_info = self._extract_email_metadata(msg, email_id)
@@ -107,15 +211,6 @@ class EmailProcessor:
             tag="MAIL",
         )
         
-        # Prepare target directory structure
-        target_dir = self._prepare_directory_structure(
-            save_path,
-            email_info,
-            organize_by_sender,
-            organize_by_date
-        )
-        dprint(f"Target directory: {target_dir}", tag="MAIL")
-        
         # Collect attachments from email
         attachments_to_save = self._collect_attachments(
             msg,
@@ -126,13 +221,27 @@ class EmailProcessor:
         
         # Save attachments if any were found
         if attachments_to_save:
-            create_directory(target_dir)
+            # Folder name and target directory are only needed from here on
+            email_info['email_folder_name'] = self._email_folder_name(email_info)
+            target_dir = self._prepare_directory_structure(
+                save_path,
+                email_info,
+                organize_by_sender,
+                organize_by_date
+            )
+            dprint(f"Target directory: {target_dir}", tag="MAIL")
+            if target_dir not in self._created_dirs and create_directory(target_dir):
+                self._created_dirs.add(target_dir)
+            # List the folder once instead of probing every candidate name
+            existing_names = get_existing_filenames(target_dir)
             
             for att_data in attachments_to_save:
                 saved_info = self._save_attachment(
                     att_data,
                     target_dir,
-                    email_info
+                    email_info,
+                    existing_names,
+                    deduplicate
                 )
                 if saved_info:
                     saved_attachments.append(saved_info)
@@ -154,6 +263,10 @@ class EmailProcessor:
         """
         Extract metadata from email message.
         
+        The folder name ('email_folder_name') is not included; it is added
+        by extract_attachments via `_email_folder_name` once there is
+        something to save.
+        
         Args:
             msg: Email message object
             email_id: Email identifier
@@ -174,11 +287,7 @@ class EmailProcessor:
         
         # Parse date
         email_date = self._parse_email_date(date_str)
-        date_for_filename = (email_date or datetime.now()).strftime('%Y-%m-%d')
-        
-        # Create email folder name
-        subject_short = sanitize_filename(subject[:50])
-        email_folder_name = f"{date_for_filename}_{message_id}_{subject_short}"
+        date_for_filename = (email_date or self._run_started).strftime('%Y-%m-%d')
         
         return {
             'sender': sender,
@@ -188,10 +297,15 @@ class EmailProcessor:
             'email_date': email_date,
             'date_for_filename': date_for_filename,
             'message_id': message_id,
-            'email_id': email_id,
-            'email_folder_name': email_folder_name
+            'email_id': email_id
         }
     
+    @staticmethod
+    def _email_folder_name(email_info: Dict) -> str:
+        """Build the per-email folder name from date, Message-ID and subject."""
+        subject_short = sanitize_filename(email_info['subject'][:50])
+        return f"{email_info['date_for_filename']}_{email_info['message_id']}_{subject_short}"
+    
     def _prepare_directory_structure(
         self,
         base_path: str,
@@ -202,6 +316,9 @@ class EmailProcessor:
         """
         Prepare the directory structure for saving attachments.
         
+        The sender/date part of the path is memoized, so repeated senders
+        and dates are only sanitized and joined once per run.
+        
         Args:
             base_path: Base save directory
             email_info: Email metadata
@@ -211,19 +328,21 @@ class EmailProcessor:
         Returns:
             Full path to the target directory
         """
-        target_dir = base_path
-        
-        if organize_by_sender:
-            sender_dir = sanitize_filename(email_info['sender_email'])
-            target_dir = os.path.join(target_dir, sender_dir)
-        
-        if organize_by_date:
-            target_dir = os.path.join(target_dir, email_info['date_for_filename'])
+        sender = email_info['sender_email'] if organize_by_sender else ''
+        date = email_info['date_for_filename'] if organize_by_date else ''
+        key = (base_path, sender, date)
+        
+        parent_dir = self._parent_dir_cache.get(key)
+        if parent_dir is None:
+            parent_dir = base_path
+            if organize_by_sender:
+                parent_dir = os.path.join(parent_dir, sanitize_filename(sender))
+            if organize_by_date:
+                parent_dir = os.path.join(parent_dir, date)
+            self._parent_dir_cache[key] = parent_dir
         
         # Email-specific folder
-        target_dir = os.path.join(target_dir, email_info['email_folder_name'])
-        
-        return target_dir
+        return os.path.join(parent_dir, email_info['email_folder_name'])
     
     def _collect_attachments(
         self,
@@ -247,19 +366,21 @@ class EmailProcessor:
         attachments_to_save = []
         attachment_counter = 0
         
-        # Debug output for patterns
-        if allowed_extensions:
-            print(Colors.info(f"  Allowed patterns: {allowed_extensions}"))
-        if excluded_extensions:
-            print(Colors.info(f"  Excluded patterns: {excluded_extensions}"))
-        
-        for part in msg.walk():
-            # Check if this part is an attachment
-            if not self._is_attachment(part):
+        # Show the patterns once, not for every email
+        patterns = (allowed_extensions, excluded_extensions)
+        if patterns != self._logged_patterns:
+            self._logged_patterns = patterns
+            if allowed_extensions:
+                print(Colors.info(f"  Allowed patterns: {allowed_extensions}"))
+            if excluded_extensions:
+                print(Colors.info(f"  Excluded patterns: {excluded_extensions}"))
+        
+        for part in self._iter_leaf_parts(msg):
+            # Check if this part is an attachment (and get its filename)
+            is_attachment, filename = self._attachment_filename(part)
+            if not is_attachment:
                 continue
             
-            # Get filename
-            filename = part.get_filename()
             original_filename = self._decode_mime_string(
                 filename or f'attachment_{attachment_counter}'
             )
@@ -295,7 +416,9 @@ class EmailProcessor:
         self,
         att_data: Dict,
         target_dir: str,
-        email_info: Dict
+        email_info: Dict,
+        existing_names: Optional[Set[str]] = None,
+        deduplicate: bool = False
     ) -> Optional[Dict]:
         """
         Save a single attachment to disk.
@@ -304,6 +427,8 @@ class EmailProcessor:
             att_data: Attachment data dictionary
             target_dir: Target directory for saving
             email_info: Email metadata
+            existing_names: Names already present in target_dir, if listed
+            deduplicate: Hard-link the file to an identical earlier attachment
             
         Returns:
             Dictionary with saved attachment information or None if failed
@@ -312,23 +437,23 @@ class EmailProcessor:
         new_filename = att_data['new_filename']
         original_filename = att_data['original_filename']
         
-        # Get unique filename if file already exists
-        unique_filename = get_unique_filename(target_dir, new_filename)
-        filepath = os.path.join(target_dir, unique_filename)
-        
         try:
-            # Extract attachment content
-            content = self._extract_attachment_content(part)
-            
-            if content is None:
-                raise ValueError("No content in MIME part")
-            
-            # Save to file
-            with open(filepath, 'wb') as f:
-                f.write(content)
-            
-            # Get file size
-            size_bytes = os.path.getsize(filepath)
+            # Decode and save to file
+            digest = _ContentDigest() if deduplicate else None
+            while True:
+                # Get unique filename if file already exists
+                unique_filename = get_unique_filename(target_dir, new_filename, existing_names)
+                filepath = os.path.join(target_dir, unique_filename)
+                try:
+                    size_bytes = self._write_attachment_content(part, filepath, digest)
+                    break
+                except FileExistsError:
+                    # Created since the folder was listed, e.g. by another
+                    # parse worker; the name is claimed now, so try the next
+                    dprint(f"{filepath} appeared meanwhile; picking another name", tag="FILE")
+            linked_to = None
+            if digest is not None and size_bytes >= self.DEDUP_MIN_SIZE:
+                linked_to = self._link_duplicate(filepath, (digest.digest(), size_bytes))
             size_mb = round(size_bytes / (1024 * 1024), 2)
             
             # Prepare attachment info
@@ -340,12 +465,15 @@ class EmailProcessor:
                 'size_mb': size_mb,
                 'sender': email_info['sender'],
                 'subject': email_info['subject'],
-                'date': (email_info['email_date'] or datetime.now()).isoformat(),
+                'date': (email_info['email_date'] or self._run_started).isoformat(),
                 'email_id': email_info['email_id'],
                 'message_id': email_info['message_id'],
                 'email_folder': email_info['email_folder_name'],
                 'attachment_number': att_data['attachment_number'],
             }
+            if digest is not None:
+                info['sha256'] = digest.hexdigest()
+                info['linked_to'] = linked_to
             
             print(Colors.success(
                 f"  Saved: {email_info['email_folder_name']}/{unique_filename} ({size_mb} MB)"
@@ -357,6 +485,7 @@ class EmailProcessor:
         except Exception as e:
             error_msg = f"Error saving {original_filename}: {e}"
             print(Colors.error(f"  {error_msg}"))
+            self.save_errors.append(error_msg)
             return None
     
     # ========== Helper Methods ==========
@@ -366,8 +495,12 @@ class EmailProcessor:
         """
         Decode MIME-encoded string.
         
+        Folded header lines are unfolded first. Raw 8-bit header bytes
+        (wrapped in a Header by the compat32 policy) and parts in charsets
+        Python does not know are decoded as UTF-8 with replacement.
+        
         Args:
-            s: MIME-encoded string or None
+            s: MIME-encoded string (or email.header.Header) or None
             
         Returns:
             Decoded string
@@ -376,14 +509,16 @@ class EmailProcessor:
             return ''
             
         try:
-            decoded_parts = decode_header(s)
-            out = []
-            for part, enc in decoded_parts:
-                if isinstance(part, bytes):
-                    out.append(part.decode(enc or 'utf-8', errors='replace'))
-                else:
-                    out.append(str(part))
-            return ''.join(out)
+            if isinstance(s, Header):
+                s = ''.join(
+                    part.decode('utf-8', errors='replace') if isinstance(part, bytes) else part
+                    for part, _ in decode_header(s)
+                )
+            s = _HEADER_FOLD_RE.sub('', s)
+            if '=?' not in s:
+                # No RFC 2047 encoded words; decode_header would return s as-is
+                return s
+            return _decode_encoded_words(s)
         except Exception:
             return str(s)
     
@@ -403,7 +538,7 @@ class EmailProcessor:
             message_id = message_id.strip('<>')
             if '@' in message_id:
                 message_id = message_id.split('@')[0]
-            message_id = re.sub(r'[^a-zA-Z0-9\-_]', '', message_id)[:20]
+            message_id = _MESSAGE_ID_CLEAN_RE.sub('', message_id)[:20]
         else:
             message_id = f"email_{email_id}"
             
@@ -424,12 +559,14 @@ class EmailProcessor:
             return 'unknown'
             
         # Try to extract email from format: "Name <email@domain.com>"
-        match = re.search(r'<([^>]+)>', sender)
-        if match:
-            return match.group(1)
+        if '<' in sender:
+            match = _SENDER_ADDRESS_RE.search(sender)
+            if match:
+                return match.group(1)
             
         # Fallback: use first word
-        return sender.split()[0] if sender.split() else 'unknown'
+        words = sender.split()
+        return words[0] if words else 'unknown'
     
     @staticmethod
     def _parse_email_date(date_str: str) -> Optional[datetime]:
@@ -450,6 +587,30 @@ class EmailProcessor:
         except Exception:
             return None
     
+    @staticmethod
+    def _iter_leaf_parts(msg: email.message.Message):
+        """
+        Yield the non-multipart parts of msg in the order msg.walk() would.
+        
+        Uses an explicit stack instead of walk()'s nested generators and
+        skips multipart containers, which never hold attachment content.
+        Attached messages (message/rfc822) are descended into like walk().
+        
+        Args:
+            msg: Email message object
+            
+        Yields:
+            Leaf MIME parts
+        """
+        stack = [msg]
+        while stack:
+            part = stack.pop()
+            if part.is_multipart():
+                # Reversed so the first child comes off the stack first
+                stack.extend(reversed(part.get_payload()))
+            else:
+                yield part
+    
     @staticmethod
     def _is_attachment(part: email.message.Message) -> bool:
         """
@@ -461,13 +622,210 @@ class EmailProcessor:
         Returns:
             True if part is an attachment
         """
+        return EmailProcessor._attachment_filename(part)[0]
+    
+    @staticmethod
+    def _attachment_filename(part: email.message.Message) -> Tuple[bool, Optional[str]]:
+        """
+        Check if a message part is an attachment and get its filename.
+        
+        Body parts are ruled out by a substring check on the raw headers;
+        the parameter parsing below only runs for parts that may qualify.
+        The filename is returned so callers need not parse it again.
+        
+        Args:
+            part: Email message part
+            
+        Returns:
+            Tuple of (is attachment, filename or None)
+        """
+        raw_disposition = str(part.get('Content-Disposition', '')).lower()
+        if 'attachment' not in raw_disposition and 'filename' not in raw_disposition:
+            # get_filename() falls back to the Content-Type "name" parameter
+            if 'name' not in str(part.get('Content-Type', '')).lower():
+                return False, None
+        
         disposition = part.get_content_disposition()
         filename = part.get_filename()
         
         # Consider it an attachment if:
         # 1. It has 'attachment' disposition, OR
         # 2. It has a filename (even with 'inline' disposition)
-        return disposition == 'attachment' or filename is not None
+        return disposition == 'attachment' or filename is not None, filename
+    
+    def _link_duplicate(self, filepath: str, key: Tuple[bytes, int]) -> Optional[str]:
+        """
+        Replace a just-written file with a hard link to an identical one.
+        
+        Args:
+            filepath: File that was just written
+            key: (sha256 digest, size) of its content
+            
+        Returns:
+            Path of the file linked to, or None if this is the first copy
+            (or linking is not possible, in which case the copy is kept)
+        """
+        canonical = self._dedup_index.get(key)
+        if canonical is None or not os.path.exists(canonical):
+            self._dedup_index[key] = filepath
+            return None
+        
+        try:
+            os.remove(filepath)
+            os.link(canonical, filepath)
+        except OSError as e:
+            # e.g. different file system or no hard link support
+            dprint(f"Hard link to {canonical} failed ({e}); keeping copy", tag="FILE")
+            if not os.path.exists(filepath):
+                shutil.copyfile(canonical, filepath)
+            return None
+        
+        dprint(f"Duplicate of {canonical}; hard-linked", tag="FILE")
+        return canonical
+    
+    @classmethod
+    def _write_attachment_content(
+        cls,
+        part: email.message.Message,
+        filepath: str,
+        digest: Optional[_ContentDigest] = None
+    ) -> int:
+        """
+        Decode an attachment part into a file.
+        
+        The file is created exclusively, so an existing file is never
+        overwritten (FileExistsError is raised instead).
+        Base64 and quoted-printable parts are decoded slice by slice straight
+        into the file, so the decoded attachment is never held in memory as
+        a whole. Parts without a transfer encoding (7bit/8bit/binary) are
+        written as-is with a single write call. Other encodings (and
+        undecodable payloads) use `_extract_attachment_content`.
+        
+        Args:
+            part: Email message part containing attachment
+            filepath: Destination file path
+            digest: Optional _ContentDigest fed the written bytes
+            
+        Returns:
+            Number of bytes written
+            
+        Raises:
+            ValueError: If the part has no content
+            FileExistsError: If filepath already exists
+        """
+        cte = str(part.get('Content-Transfer-Encoding', '')).strip().lower()
+        payload = part.get_payload(decode=False)
+        
+        streamer = {
+            'base64': cls._stream_base64,
+            'quoted-printable': cls._stream_quoted_printable,
+        }.get(cte)
+        mode = 'xb'
+        if streamer is not None and isinstance(payload, str):
+            try:
+                with open(filepath, mode, buffering=cls._write_buffer_size(payload)) as f:
+                    mode = 'wb'  # the fallback below rewrites our own file
+                    return streamer(payload, f, digest)
+            except (binascii.Error, ValueError) as e:
+                dprint(f"Streaming {cte} decode failed ({e}); decoding in memory", tag="FILE")
+                if digest is not None:
+                    digest.reset()
+        
+        content = None
+        if cte in IDENTITY_TRANSFER_ENCODINGS and isinstance(payload, str):
+            # Messages parsed from bytes keep non-ASCII bytes as surrogates;
+            # this restores the original bytes in a single pass
+            try:
+                content = payload.encode('ascii', 'surrogateescape')
+            except UnicodeEncodeError:
+                content = None
+        
+        if content is None:
+            content = cls._extract_attachment_content(part)
+        if content is None:
+            raise ValueError("No content in MIME part")
+        
+        with open(filepath, mode) as f:
+            f.write(content)
+        if digest is not None:
+            digest.update(content)
+        return len(content)
+    
+    @staticmethod
+    def _write_buffer_size(payload: str) -> int:
+        """
+        Pick the file buffer size for streaming a payload.
+        
+        The decoded content is never longer than the encoded payload, so a
+        buffer of that size still takes the whole file in one write, while
+        small attachments no longer each allocate the full 1 MiB buffer.
+        """
+        return max(io.DEFAULT_BUFFER_SIZE, min(ATTACHMENT_WRITE_BUFFER, len(payload)))
+    
+    @staticmethod
+    def _stream_base64(payload: str, fh, digest=None) -> int:
+        """
+        Decode a base64 string into an open binary file in chunks.
+        
+        Whitespace is dropped and any incomplete 4-character group is carried
+        over to the next slice. ``digest`` (if given) is fed the decoded
+        bytes as they are written.
+        
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        carry = ''
+        for start in range(0, len(payload), ATTACHMENT_CHUNK_SIZE):
+            piece = carry + ''.join(payload[start:start + ATTACHMENT_CHUNK_SIZE].split())
+            usable = len(piece) - len(piece) % 4
+            carry = piece[usable:]
+            if usable:
+                data = _base64.b64decode(piece[:usable])
+                fh.write(data)
+                if digest is not None:
+                    digest.update(data)
+                written += len(data)
+        
+        if carry:
+            # Tolerate missing padding at the end, like get_payload(decode=True)
+            data = _base64.b64decode(carry + '=' * (-len(carry) % 4))
+            fh.write(data)
+            if digest is not None:
+                digest.update(data)
+            written += len(data)
+        
+        return written
+    
+    @staticmethod
+    def _stream_quoted_printable(payload: str, fh, digest=None) -> int:
+        """
+        Decode a quoted-printable string into an open binary file in chunks.
+        
+        Slices end on a line break so soft line breaks ("=" at the end of a
+        line) are never split. Non-ASCII input raises UnicodeEncodeError.
+        
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        start = 0
+        length = len(payload)
+        while start < length:
+            end = min(start + ATTACHMENT_CHUNK_SIZE, length)
+            if end < length:
+                newline = payload.rfind('\n', start, end)
+                if newline < start:
+                    # Line longer than a slice: extend to its end
+                    newline = payload.find('\n', end)
+                end = newline + 1 if newline >= 0 else length
+            data = binascii.a2b_qp(payload[start:end].encode('ascii', 'surrogateescape'))
+            fh.write(data)
+            if digest is not None:
+                digest.update(data)
+            written += len(data)
+            start = end
+        return written
     
     @staticmethod
     def _extract_attachment_content(part: email.message.Message) -> Optional[bytes]:
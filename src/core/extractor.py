@@ -7,20 +7,159 @@ This module contains the main EmailAttachmentExtractor class that handles
 IMAP connections, mailbox navigation, and orchestrates the extraction process.
 """
 
+import contextlib
 import imaplib
 # imaplib.Debug = 4
+import io
 import ssl
 import json
+import socket
+import multiprocessing
 import os
+import queue
+import re
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    # Optional fast JSON encoder for metadata files
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..utils.colors import Colors, ProgressIndicator
-from ..utils.debug import dprint, mask_secret, is_enabled as debug_enabled
-from ..utils.filesystem import create_directory
+from ..utils.debug import dprint, enable_debug, mask_secret, is_enabled as debug_enabled
+from ..utils.filesystem import create_directory, sanitize_filename
+from .bodystructure import messages_with_attachments
 from .email_processor import EmailProcessor
 from .pattern_matcher import PatternMatcher
+from .seen_state import SeenMessages
+
+
+# Leading message number of a FETCH response item, e.g. b'12 (BODY[] {3456}'
+_FETCH_ID_RE = re.compile(rb'^(\d+) ')
+
+# Message number and UID in a FETCH (UID) response, e.g. b'12 (UID 4711)'
+_FETCH_UID_RE = re.compile(rb'^(\d+) \(.*\bUID (\d+)')
+
+# IMAP LIST response line: (flags) "delimiter" mailbox_name (delimiter may be NIL)
+_MAILBOX_LIST_RE = re.compile(rb'\(([^)]*)\)\s+(?:"([^"]*)"|NIL)\s+(.+)', re.IGNORECASE)
+
+# Attachment records are appended here while extracting (one JSON object per line)
+METADATA_LOG_NAME = 'attachments_metadata.jsonl'
+
+# Queued in place of raw bytes for messages the BODYSTRUCTURE probe ruled out
+_SKIPPED = object()
+
+def _message_set(email_ids: List[str]) -> str:
+    """
+    Build an IMAP message set, collapsing consecutive ids into ranges.
+    
+    ['1', '2', '3', '7'] becomes '1:3,7', which keeps FETCH command lines
+    short for large batches.
+    """
+    parts: List[str] = []
+    run_start = run_end = None
+    for eid in email_ids:
+        if eid.isdigit() and run_end is not None and int(eid) == run_end + 1:
+            run_end += 1
+            continue
+        if run_start is not None:
+            parts.append(str(run_start) if run_start == run_end else f'{run_start}:{run_end}')
+            run_start = run_end = None
+        if eid.isdigit():
+            run_start = run_end = int(eid)
+        else:
+            parts.append(eid)
+    if run_start is not None:
+        parts.append(str(run_start) if run_start == run_end else f'{run_start}:{run_end}')
+    return ','.join(parts)
+
+
+# EmailProcessor of a parse worker process, created on first use
+_worker_processor: Optional[EmailProcessor] = None
+
+
+def _json_line(record: Dict) -> bytes:
+    """Encode a record as one UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+class _MetadataLog:
+    """Appends attachment records to a JSONL file, opened on first write."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._fh = None
+    
+    def write(self, records: List[Dict]):
+        if self._fh is None:
+            self._fh = open(self.path, 'ab')
+        for record in records:
+            self._fh.write(_json_line(record))
+        self.count += len(records)
+    
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def _init_parse_worker(colors_enabled: bool, debug: bool):
+    """Apply the parent's color and debug settings in a parse worker."""
+    Colors._initialized = True
+    Colors._enabled = colors_enabled
+    enable_debug(debug)
+
+
+def _parse_in_worker(
+    eid: str,
+    idx: int,
+    total: int,
+    raw_email: bytes,
+    server: str,
+    options: Dict
+) -> Tuple[List[Dict], Optional[str], List[str], str]:
+    """
+    Parse one email and save its attachments in a worker process.
+    
+    Console output is captured and handed back so the main process can
+    print it in order (and mirror it to the log file).
+    
+    Returns:
+        Tuple of (attachment info list, error message or None, errors of
+        attachments that could not be saved, captured output)
+    """
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = EmailProcessor()
+    
+    attachments: List[Dict] = []
+    error = None
+    save_errors: List[str] = []
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        print(Colors.info(f"\nProcessing email {idx}/{total} (ID {eid})..."))
+        try:
+            msg = _worker_processor.parse_email(raw_email, server, headers_only_if_plain=True)
+            attachments = _worker_processor.extract_attachments(
+                email_id=eid,
+                msg=msg,
+                pattern_matcher=PatternMatcher(),
+                **options
+            )
+            save_errors = _worker_processor.save_errors
+        except Exception as e:
+            error = f"Error processing email {eid}: {e}"
+            print(Colors.error(error))
+    return attachments, error, save_errors, out.getvalue()
 
 
 class EmailAttachmentExtractor:
@@ -31,6 +170,39 @@ class EmailAttachmentExtractor:
     the email processing workflow.
     """
     
+    # Number of messages requested per FETCH command. Larger batches save
+    # round trips but some servers reject overly long command lines.
+    BULK_FETCH_SIZE = 100
+    BULK_FETCH_SIZE_MAX = 500
+    
+    # Upper bound for parallel IMAP connections in recursive mode. Most
+    # providers cap concurrent sessions per account (Gmail allows ~15).
+    FOLDER_WORKERS_MAX = 4
+    
+    # Maximum number of fetched messages buffered ahead of parsing/saving
+    PIPELINE_QUEUE_SIZE = 32
+    
+    # Ask for BODYSTRUCTURE first and only download messages that may carry
+    # attachments
+    PROBE_BODYSTRUCTURE = True
+    
+    # FETCH item for full messages. PEEK leaves \Seen alone even where the
+    # mailbox is selected read-write (iCloud), and unlike RFC822 it works
+    # on iCloud, so one spec serves every server.
+    FETCH_BODY_SPEC = '(BODY.PEEK[])'
+    
+    # Messages covered by one BODYSTRUCTURE probe. Structures are small, so
+    # probing many at once leaves the body FETCHes as the only other round
+    # trips and lets them be filled with candidates only.
+    PROBE_BATCH_SIZE = 1000
+    
+    # Error messages kept in statistics; further errors are only counted
+    MAX_ERRORS_KEPT = 100
+    
+    # TLS context shared by all connections; loading the CA store is costly
+    _ssl_context: Optional[ssl.SSLContext] = None
+    _ssl_context_lock = threading.Lock()
+    
     def __init__(
         self,
         server: str,
@@ -65,8 +237,21 @@ class EmailAttachmentExtractor:
             'emails_processed': 0,
             'attachments_saved': 0,
             'total_size_mb': 0.0,
-            'errors': []
+            'errors': [],
+            'errors_dropped': 0
         }
+        # Guards statistics updates when folders are processed in parallel
+        self._stats_lock = threading.Lock()
+        # Result of the last successful LIST; folders rarely change mid-run
+        self._mbox_cache: Optional[List[str]] = None
+        # Hierarchy delimiter and \Noselect folders from the same LIST
+        self._mbox_delimiter = '/'
+        self._noselect: set = set()
+        # Encoded SEARCH arguments per criteria string (reused across folders)
+        self._search_args_cache: Dict[str, Tuple[Optional[str], object]] = {}
+        # Selected mailbox and its UIDVALIDITY (None if not reported)
+        self._selected_mailbox: Optional[str] = None
+        self._uidvalidity: Optional[int] = None
         
     def connect(self) -> bool:
         """
@@ -81,14 +266,14 @@ class EmailAttachmentExtractor:
                 tag="IMAP",
             )
             if self.use_ssl:
-                context = ssl.create_default_context()
                 self.imap = imaplib.IMAP4_SSL(
                     self.server, 
                     self.port, 
-                    ssl_context=context
+                    ssl_context=self._get_ssl_context()
                 )
             else:
                 self.imap = imaplib.IMAP4(self.server, self.port)
+            self._tune_socket(self.imap.sock)
                 
             self.imap.login(self.username, self.password)
             print(Colors.success(f"Successfully connected to {self.server}"))
@@ -102,6 +287,28 @@ class EmailAttachmentExtractor:
             print(Colors.error(f"Connection error: {e}"))
             return False
     
+    @classmethod
+    def _get_ssl_context(cls) -> ssl.SSLContext:
+        """Return the shared TLS context, creating it on first use."""
+        with cls._ssl_context_lock:
+            if cls._ssl_context is None:
+                cls._ssl_context = ssl.create_default_context()
+            return cls._ssl_context
+    
+    @staticmethod
+    def _tune_socket(sock):
+        """
+        Disable Nagle's algorithm on the IMAP socket.
+        
+        Commands are small and each waits for its reply, so delaying them
+        to coalesce segments only adds latency. The receive buffer is left
+        to the kernel, whose autotuning can grow it past any fixed size.
+        """
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (OSError, AttributeError) as e:
+            dprint(f"Could not set TCP_NODELAY: {e}", tag="IMAP")
+    
     def disconnect(self):
         """Close the IMAP connection."""
         if self.imap:
@@ -111,33 +318,82 @@ class EmailAttachmentExtractor:
             except Exception:
                 pass
     
-    def get_mailboxes(self) -> List[str]:
+    def get_mailboxes(self, refresh: bool = False) -> List[str]:
         """
         Get list of available mailboxes/folders.
         
+        The whole hierarchy is listed with a single ``LIST "" "*"`` and
+        cached for the session.
+        
+        Args:
+            refresh: Ask the server again instead of using the cache
+            
         Returns:
             List of mailbox names
         """
+        if self._mbox_cache is not None and not refresh:
+            return list(self._mbox_cache)
+        
         try:
-            status, mailboxes = self.imap.list()
+            status, mailboxes = self.imap.list('""', '*')
             if status != 'OK' or not mailboxes:
                 return []
             
             folders: List[str] = []
+            noselect = set()
             for raw in mailboxes:
-                if raw is None:
+                parsed = self._parse_list_item(raw)
+                if parsed is None:
                     continue
+                flags, delimiter, folder_name = parsed
+                folders.append(folder_name)
+                if delimiter:
+                    self._mbox_delimiter = delimiter
+                if b'\\noselect' in flags.lower():
+                    # Hierarchy placeholder; SELECT would fail
+                    noselect.add(folder_name)
                     
-                # Parse IMAP LIST response
-                folder_name = self._parse_mailbox_name(raw)
-                if folder_name:
+            dprint(f"Fetched {len(folders)} mailbox(es), delimiter '{self._mbox_delimiter}'", tag="IMAP")
+            self._noselect = noselect
+            self._mbox_cache = folders
+            return list(folders)
+            
+        except Exception as e:
+            print(Colors.error(f"Error fetching mailboxes: {e}"))
+            return []
+    
+    def get_subscribed_mailboxes(self) -> List[str]:
+        """
+        Get the subscribed mailboxes with a single ``LSUB "" "*"``.
+        
+        On large account trees this answer is much smaller than the full
+        LIST. Entries flagged \\Noselect are left out: in an LSUB answer they
+        are unsubscribed parents of subscribed folders.
+        
+        Returns:
+            List of subscribed mailbox names
+        """
+        try:
+            status, mailboxes = self.imap.lsub('""', '*')
+            if status != 'OK' or not mailboxes:
+                return []
+            
+            folders: List[str] = []
+            for raw in mailboxes:
+                parsed = self._parse_list_item(raw)
+                if parsed is None:
+                    continue
+                flags, delimiter, folder_name = parsed
+                if delimiter:
+                    self._mbox_delimiter = delimiter
+                if b'\\noselect' not in flags.lower():
                     folders.append(folder_name)
-                    
-            dprint(f"Fetched {len(folders)} mailbox(es)", tag="IMAP")
+            
+            dprint(f"Fetched {len(folders)} subscribed mailbox(es)", tag="IMAP")
             return folders
             
         except Exception as e:
-            print(Colors.error(f"Error fetching mailboxes: {e}"))
+            print(Colors.error(f"Error fetching subscribed mailboxes: {e}"))
             return []
     
     def select_mailbox(self, mailbox: str = 'INBOX') -> bool:
@@ -163,6 +419,8 @@ class EmailAttachmentExtractor:
                 status, _ = self.imap.select(mailbox, readonly=True)
                 
             if status == 'OK':
+                self._selected_mailbox = mailbox
+                self._uidvalidity = self._read_uidvalidity()
                 print(Colors.success(f"Mailbox '{mailbox}' selected"))
                 dprint(f"Mailbox '{mailbox}' ready", tag="IMAP")
                 return True
@@ -174,10 +432,24 @@ class EmailAttachmentExtractor:
             print(Colors.error(f"Error selecting mailbox: {e}"))
             return False
     
+    def _read_uidvalidity(self) -> Optional[int]:
+        """Return the UIDVALIDITY sent with the last SELECT, if any."""
+        try:
+            _, data = self.imap.response('UIDVALIDITY')
+            if data and data[-1] is not None:
+                value = data[-1]
+                if isinstance(value, bytes):
+                    value = value.decode('ascii')
+                return int(value)
+        except (AttributeError, ValueError, TypeError, UnicodeDecodeError):
+            pass
+        return None
+    
     def search_emails(
         self, 
         search_criteria: str = 'ALL', 
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        attachments_only: bool = False
     ) -> List[str]:
         """
         Search for emails matching criteria.
@@ -185,12 +457,17 @@ class EmailAttachmentExtractor:
         Args:
             search_criteria: IMAP search criteria
             limit: Maximum number of emails to return
+            attachments_only: Let the server narrow the search to messages
+                that likely carry attachments
             
         Returns:
             List of email IDs
         """
+        if attachments_only:
+            search_criteria = self._attachment_search_criteria(search_criteria)
         try:
-            status, data = self.imap.search(None, search_criteria)
+            charset, criteria = self._search_args(search_criteria)
+            status, data = self.imap.search(charset, criteria)
             if status != 'OK' or not data or not data[0]:
                 dprint(f"Search returned no results (status={status})", tag="IMAP")
                 return []
@@ -217,11 +494,22 @@ class EmailAttachmentExtractor:
         limit: Optional[int] = None,
         save_metadata: bool = True,
         allowed_extensions: Optional[List[str]] = None,
-        excluded_extensions: Optional[List[str]] = None
+        excluded_extensions: Optional[List[str]] = None,
+        attachments_only: bool = False,
+        json_pretty: bool = False,
+        parse_workers: int = 1,
+        deduplicate: bool = False,
+        bulk_size: Optional[int] = None,
+        email_ids: Optional[List[str]] = None,
+        incremental: bool = False
     ) -> Dict:
         """
         Process emails and extract attachments.
         
+        Attachment metadata is appended to attachments_metadata.jsonl as each
+        email is processed. With ``json_pretty`` the records are collected
+        and written as one indented attachments_metadata.json at the end.
+        
         Args:
             save_path: Directory to save attachments
             search_criteria: IMAP search criteria
@@ -231,6 +519,16 @@ class EmailAttachmentExtractor:
             save_metadata: Whether to save metadata JSON
             allowed_extensions: List of allowed file patterns
             excluded_extensions: List of excluded file patterns
+            attachments_only: Search only for messages with attachments
+            json_pretty: Write a single indented JSON file instead of JSONL
+            parse_workers: Worker processes for parsing and saving emails
+            deduplicate: Hard-link attachments identical to earlier ones
+            bulk_size: Messages per FETCH command (default BULK_FETCH_SIZE)
+            email_ids: Ids from an earlier search of the selected mailbox;
+                skips the search
+            incremental: Skip messages extracted by earlier runs into
+                save_path and remember the ones handled now (only when no
+                allowed/excluded patterns are set)
             
         Returns:
             Statistics dictionary
@@ -238,8 +536,14 @@ class EmailAttachmentExtractor:
         # Create save directory
         create_directory(save_path)
         
-        print(Colors.info(f"\nSearching emails with criteria: {search_criteria}"))
-        email_ids = self.search_emails(search_criteria, limit)
+        # Incremental runs drop the seen messages first so the limit
+        # applies to new mail only
+        search_limit = None if incremental else limit
+        if email_ids is None:
+            print(Colors.info(f"\nSearching emails with criteria: {search_criteria}"))
+            email_ids = self.search_emails(search_criteria, search_limit, attachments_only=attachments_only)
+        elif search_limit is not None:
+            email_ids = email_ids[:max(0, int(search_limit))]
         
         if not email_ids:
             print(Colors.warning("No emails found"))
@@ -247,45 +551,126 @@ class EmailAttachmentExtractor:
         
         print(Colors.info(f"{len(email_ids)} email(s) found"))
         
+        seen = None
+        uids: Dict[str, str] = {}
+        if incremental:
+            seen, uids = self._load_seen(save_path, email_ids)
+            if seen is not None:
+                email_ids = [eid for eid in email_ids if uids.get(eid) not in seen]
+                if not email_ids:
+                    print(Colors.info("All emails were extracted in an earlier run"))
+                    seen.close()
+                    return self.statistics
+            if limit is not None:
+                email_ids = email_ids[:max(0, int(limit))]
+        
+        # Filter patterns are not part of the state, so only unfiltered runs
+        # record messages; a later run with other patterns would skip them
+        accept = self._filename_filter(allowed_extensions, excluded_extensions)
+        remember = seen if accept is None else None
+        
+        options = {
+            'save_path': save_path,
+            'organize_by_sender': organize_by_sender,
+            'organize_by_date': organize_by_date,
+            'allowed_extensions': allowed_extensions,
+            'excluded_extensions': excluded_extensions,
+            'deduplicate': deduplicate
+        }
         all_attachments: List[Dict] = []
+        metadata_log = None
+        if save_metadata and not json_pretty:
+            metadata_log = _MetadataLog(os.path.join(save_path, METADATA_LOG_NAME))
+        collected = all_attachments if save_metadata and json_pretty else None
+        total = len(email_ids)
+        idx = 0
+        skipped = 0
         
-        for idx, eid in enumerate(email_ids, 1):
-            try:
-                print(Colors.info(f"\nProcessing email {idx}/{len(email_ids)} (ID {eid})..."))
-                
-                # Fetch email
-                raw_email = self._fetch_email(eid)
-                if not raw_email:
+        # Fetch on a background thread so network round trips overlap with
+        # parsing and disk writes on this thread.
+        raw_queue: queue.Queue = queue.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        stop = threading.Event()
+        fetcher = threading.Thread(
+            target=self._fetch_worker,
+            args=(email_ids, raw_queue, stop, bulk_size, accept),
+            name='imap-fetch',
+            daemon=True
+        )
+        fetcher.start()
+        
+        # Optionally parse and save in worker processes to use more than one
+        # CPU core; at most two messages per worker are in flight.
+        workers = max(1, min(parse_workers or 1, os.cpu_count() or 1))
+        pool = self._create_parse_pool(workers) if workers > 1 else None
+        in_flight: deque = deque()
+        
+        try:
+            while True:
+                item = raw_queue.get()
+                if item is None:
+                    break
+                eid, raw_email = item
+                idx += 1
+                if raw_email is _SKIPPED:
+                    # No attachments according to BODYSTRUCTURE
+                    skipped += 1
+                    with self._stats_lock:
+                        self.statistics['emails_processed'] += 1
+                    if remember is not None:
+                        remember.add(uids.get(eid))
                     continue
-                
-                # Parse and process email
-                msg = self.email_processor.parse_email(raw_email, self.server)
-                
-                # Extract attachments
-                attachments = self.email_processor.extract_attachments(
-                    email_id=eid,
-                    msg=msg,
-                    save_path=save_path,
-                    organize_by_sender=organize_by_sender,
-                    organize_by_date=organize_by_date,
-                    allowed_extensions=allowed_extensions,
-                    excluded_extensions=excluded_extensions,
-                    pattern_matcher=self.pattern_matcher
+                if pool is not None and raw_email:
+                    future = pool.submit(
+                        _parse_in_worker, eid, idx, total, raw_email, self.server, options
+                    )
+                    in_flight.append((eid, future))
+                    while len(in_flight) >= 2 * workers:
+                        done_eid, future = in_flight.popleft()
+                        attachments, complete = self._collect_parsed(done_eid, future)
+                        self._record_attachments(attachments, metadata_log, collected)
+                        if remember is not None and complete:
+                            remember.add(uids.get(done_eid))
+                    continue
+                attachments, complete = self._process_single_email(
+                    eid=eid,
+                    idx=idx,
+                    total=total,
+                    raw_email=raw_email,
+                    **options
                 )
-                
-                all_attachments.extend(attachments)
-                self.statistics['emails_processed'] += 1
-                self.statistics['attachments_saved'] += len(attachments)
-                self.statistics['total_size_mb'] += sum(a['size_mb'] for a in attachments)
-                
-            except Exception as e:
-                err = f"Error processing email {eid}: {e}"
-                print(Colors.error(err))
-                self.statistics['errors'].append(err)
+                self._record_attachments(attachments, metadata_log, collected)
+                if remember is not None and complete:
+                    remember.add(uids.get(eid))
+            
+            while in_flight:
+                done_eid, future = in_flight.popleft()
+                attachments, complete = self._collect_parsed(done_eid, future)
+                self._record_attachments(attachments, metadata_log, collected)
+                if remember is not None and complete:
+                    remember.add(uids.get(done_eid))
+        finally:
+            stop.set()
+            fetcher.join()
+            if pool is not None:
+                for _, future in in_flight:
+                    future.cancel()
+                pool.shutdown(wait=True)
+            if metadata_log is not None:
+                metadata_log.close()
+            if seen is not None:
+                seen.close()
+        
+        if skipped:
+            print(Colors.info(f"\n{skipped} email(s) without attachments skipped"))
+        
+        if metadata_log is not None and metadata_log.count:
+            print(Colors.success(
+                f"\nMetadata for {metadata_log.count} attachment(s) appended to: {metadata_log.path}"
+            ))
         
         # Save metadata if requested
-        if save_metadata and all_attachments:
-            self._save_metadata(save_path, all_attachments)
+        if collected:
+            self._save_metadata(save_path, collected)
         
         return self.statistics
     
@@ -299,11 +684,24 @@ class EmailAttachmentExtractor:
         total_limit: Optional[int] = None,
         save_metadata: bool = True,
         allowed_extensions: Optional[List[str]] = None,
-        excluded_extensions: Optional[List[str]] = None
+        excluded_extensions: Optional[List[str]] = None,
+        folder_workers: int = 1,
+        attachments_only: bool = False,
+        json_pretty: bool = False,
+        parse_workers: int = 1,
+        deduplicate: bool = False,
+        bulk_size: Optional[int] = None,
+        incremental: bool = False,
+        subscribed_only: bool = False
     ) -> Dict:
         """
         Process INBOX and all subfolders recursively.
         
+        With ``folder_workers > 1`` each folder is processed on its own IMAP
+        connection in a thread pool. Parallel mode is skipped when a total
+        limit is set, since that limit depends on processing folders in order;
+        a second connection then looks up the next folder in the meantime.
+        
         Args:
             save_path: Directory to save attachments
             search_criteria: IMAP search criteria
@@ -314,45 +712,79 @@ class EmailAttachmentExtractor:
             save_metadata: Whether to save metadata
             allowed_extensions: Allowed file patterns
             excluded_extensions: Excluded file patterns
+            folder_workers: Number of parallel IMAP connections
+            attachments_only: Search only for messages with attachments
+            json_pretty: Write per-folder metadata as indented JSON
+            parse_workers: Worker processes for parsing and saving emails
+            deduplicate: Hard-link attachments identical to earlier ones
+            bulk_size: Messages per FETCH command
+            incremental: Skip messages extracted by earlier runs
+            subscribed_only: Only process subscribed subfolders (INBOX itself
+                is always processed)
             
         Returns:
             Statistics dictionary
         """
         # Get all INBOX folders
-        all_mailboxes = self.get_mailboxes()
+        if subscribed_only:
+            all_mailboxes = self.get_subscribed_mailboxes()
+        else:
+            all_mailboxes = self.get_mailboxes()
         inbox_folders = self._filter_inbox_folders(all_mailboxes)
         
         print(Colors.info(f"\nFound {len(inbox_folders)} INBOX folder(s):"))
         for folder in inbox_folders:
             print(f"   - {folder}")
         
-        processed_count = 0
+        workers = max(1, min(folder_workers or 1, self.FOLDER_WORKERS_MAX, len(inbox_folders)))
+        standby = None
+        if workers > 1 and total_limit:
+            print(Colors.warning("Total limit set; processing folders sequentially"))
+            # Use a second connection to look up the next folder ahead of time
+            standby = self._spawn_worker()
+            if not standby.connect():
+                standby = None
+            workers = 1
         
-        for folder in inbox_folders:
-            if total_limit and processed_count >= total_limit:
-                print(Colors.warning(f"\nTotal limit of {total_limit} emails reached"))
-                break
-            
-            # Calculate effective limit for this folder
-            effective_limit = self._calculate_effective_limit(
-                limit_per_folder, 
-                total_limit, 
-                processed_count
+        options = {
+            'search_criteria': search_criteria,
+            'organize_by_sender': organize_by_sender,
+            'organize_by_date': organize_by_date,
+            'save_metadata': save_metadata,
+            'allowed_extensions': allowed_extensions,
+            'excluded_extensions': excluded_extensions,
+            'attachments_only': attachments_only,
+            'json_pretty': json_pretty,
+            'parse_workers': parse_workers,
+            'deduplicate': deduplicate,
+            'bulk_size': bulk_size,
+            'incremental': incremental
+        }
+        
+        if workers > 1:
+            self._process_folders_parallel(
+                folders=inbox_folders,
+                workers=workers,
+                save_path=save_path,
+                limit=limit_per_folder,
+                **options
             )
-            
-            # Process folder
-            processed_count = self._process_mailbox(
-                mailbox=folder,
+            if save_metadata:
+                self._save_total_metadata(save_path, inbox_folders)
+            return self.statistics
+        
+        try:
+            self._process_folders_sequential(
+                folders=inbox_folders,
                 save_path=save_path,
-                search_criteria=search_criteria,
-                organize_by_sender=organize_by_sender,
-                organize_by_date=organize_by_date,
-                limit=effective_limit,
-                save_metadata=save_metadata,
-                processed_count=processed_count,
-                allowed_extensions=allowed_extensions,
-                excluded_extensions=excluded_extensions
+                limit_per_folder=limit_per_folder,
+                total_limit=total_limit,
+                standby=standby,
+                **options
             )
+        finally:
+            if standby is not None:
+                standby.disconnect()
         
         # Save overall metadata
         if save_metadata:
@@ -369,32 +801,458 @@ class EmailAttachmentExtractor:
         The typical LIST response is: (flags) "delimiter" "mailbox"
         This method attempts a best-effort parse and returns None on errors.
         """
+        parsed = self._parse_list_item(raw)
+        return parsed[2] if parsed else None
+    
+    @staticmethod
+    def _parse_list_item(item) -> Optional[Tuple[bytes, Optional[str], str]]:
+        """
+        Split one item of a LIST response into flags, delimiter and name.
+        
+        The line is matched as bytes; only the delimiter and name are
+        decoded. Names the server sent as a literal arrive as a
+        ``(line, name)`` tuple.
+        
+        Returns:
+            Tuple of (raw flags, delimiter or None, mailbox name), or None
+            if the item is not a LIST line
+        """
+        literal = None
+        if isinstance(item, tuple) and len(item) >= 2:
+            item, literal = item[0], item[1]
+        if not isinstance(item, bytes):
+            return None
+        match = _MAILBOX_LIST_RE.match(item)
+        if not match:
+            return None
+        flags, delimiter, name = match.groups()
+        if isinstance(literal, bytes):
+            name = literal
+        else:
+            name = name.strip(b'"')
+        return (
+            flags,
+            delimiter.decode(errors='replace') if delimiter else None,
+            name.decode(errors='replace')
+        )
+    
+    def _search_args(self, search_criteria: str) -> Tuple[Optional[str], object]:
+        """
+        Return the charset and criteria argument for IMAP4.search.
+        
+        imaplib sends str arguments as ASCII, so criteria with other
+        characters (e.g. SUBJECT "Rechnung März") are encoded as UTF-8 bytes
+        with CHARSET UTF-8. The result is cached for the next folder.
+        """
+        args = self._search_args_cache.get(search_criteria)
+        if args is None:
+            try:
+                search_criteria.encode('ascii')
+                args = (None, search_criteria)
+            except UnicodeEncodeError:
+                args = ('UTF-8', search_criteria.encode('utf-8'))
+            self._search_args_cache[search_criteria] = args
+        return args
+    
+    def _attachment_search_criteria(self, search_criteria: str) -> str:
+        """
+        Extend search criteria so the server only returns messages with attachments.
+        
+        Gmail understands its own search syntax via X-GM-RAW; other servers
+        get a Content-Type header match, which catches the usual
+        multipart/mixed layout. Search keys separated by spaces are ANDed.
+        """
+        criteria = (search_criteria or 'ALL').strip()
+        if 'imap.gmail.com' in self.server:
+            return f'{criteria} X-GM-RAW "has:attachment"'
+        return f'{criteria} HEADER Content-Type "multipart/mixed"'
+    
+    def _process_single_email(
+        self,
+        eid: str,
+        idx: int,
+        total: int,
+        raw_email: Optional[bytes],
+        save_path: str,
+        organize_by_sender: bool,
+        organize_by_date: bool,
+        allowed_extensions: Optional[List[str]],
+        excluded_extensions: Optional[List[str]],
+        deduplicate: bool = False
+    ) -> Tuple[Optional[List[Dict]], bool]:
+        """
+        Parse one fetched email, save its attachments and update statistics.
+        
+        Returns:
+            Tuple of (saved attachment info, possibly empty, or None if the
+            email could not be fetched or processed; True if every included
+            attachment was written)
+        """
         try:
-            line = raw.decode(errors='replace')
-            # Parse format: (flags) "delimiter" mailbox_name
-            import re
-            match = re.match(r'\([^)]*\)\s+"[^"]*"\s+(.+)', line)
-            if match:
-                return match.group(1).strip('"')
+            print(Colors.info(f"\nProcessing email {idx}/{total} (ID {eid})..."))
+            
+            if not raw_email:
+                return None, False
+                
+            # Parse and process email (headers only if it cannot have attachments)
+            msg = self.email_processor.parse_email(
+                raw_email, self.server, headers_only_if_plain=True
+            )
+            
+            # Extract attachments
+            attachments = self.email_processor.extract_attachments(
+                email_id=eid,
+                msg=msg,
+                save_path=save_path,
+                organize_by_sender=organize_by_sender,
+                organize_by_date=organize_by_date,
+                allowed_extensions=allowed_extensions,
+                excluded_extensions=excluded_extensions,
+                pattern_matcher=self.pattern_matcher,
+                deduplicate=deduplicate
+            )
+            
+            save_errors = self.email_processor.save_errors
+            with self._stats_lock:
+                self.statistics['emails_processed'] += 1
+                self.statistics['attachments_saved'] += len(attachments)
+                self.statistics['total_size_mb'] += sum(a['size_mb'] for a in attachments)
+                for err in save_errors:
+                    self._add_error(f"Email {eid}: {err}")
+            return attachments, not save_errors
+            
+        except Exception as e:
+            err = f"Error processing email {eid}: {e}"
+            print(Colors.error(err))
+            with self._stats_lock:
+                self._add_error(err)
+            return None, False
+    
+    def _add_error(self, err: str):
+        """
+        Record an error message; call with the statistics lock held.
+        
+        Only the first MAX_ERRORS_KEPT messages are stored so runs over
+        huge mailboxes cannot pile up errors in memory.
+        """
+        if len(self.statistics['errors']) < self.MAX_ERRORS_KEPT:
+            self.statistics['errors'].append(err)
+        else:
+            self.statistics['errors_dropped'] += 1
+    
+    def _create_parse_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Start a process pool for parsing emails."""
+        dprint(f"Parsing emails in {workers} worker process(es)", tag="RUN")
+        # Spawn rather than fork: the fetch thread is already running
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_parse_worker,
+            initargs=(Colors.is_enabled(), debug_enabled())
+        )
+    
+    def _collect_parsed(self, eid: str, future) -> Tuple[Optional[List[Dict]], bool]:
+        """
+        Wait for a worker result, print its output and update statistics.
+        
+        Returns:
+            Tuple of (saved attachment info, possibly empty, or None if the
+            worker reported an error; True if every included attachment
+            was written)
+        """
+        try:
+            attachments, error, save_errors, output = future.result()
+        except Exception as e:
+            attachments, error, save_errors, output = [], f"Error processing email {eid}: {e}", [], ''
+            print(Colors.error(error))
+        
+        if output:
+            print(output, end='')
+        
+        with self._stats_lock:
+            if error:
+                self._add_error(error)
+            else:
+                self.statistics['emails_processed'] += 1
+                self.statistics['attachments_saved'] += len(attachments)
+                self.statistics['total_size_mb'] += sum(a['size_mb'] for a in attachments)
+                for err in save_errors:
+                    self._add_error(f"Email {eid}: {err}")
+        if error:
+            return None, False
+        return attachments, not save_errors
+    
+    @staticmethod
+    def _record_attachments(
+        attachments: Optional[List[Dict]],
+        metadata_log: Optional[_MetadataLog],
+        collected: Optional[List[Dict]]
+    ):
+        """Pass saved attachment info to the metadata log or the pretty-JSON list."""
+        if not attachments:
+            return
+        if metadata_log is not None:
+            try:
+                metadata_log.write(attachments)
+            except OSError as e:
+                print(Colors.error(f"Error saving metadata: {e}"))
+        elif collected is not None:
+            collected.extend(attachments)
+    
+    def _fetch_worker(
+        self,
+        email_ids: List[str],
+        out_queue: queue.Queue,
+        stop: threading.Event,
+        bulk_size: Optional[int] = None,
+        accept: Optional[Callable[[str], bool]] = None
+    ):
+        """
+        Fetch emails in batches and queue ``(eid, raw_bytes)`` pairs.
+        
+        Runs on the fetch thread and is the only user of the IMAP connection
+        while a pipeline is active. Ids missing from a bulk response are
+        fetched individually; ``raw_bytes`` is None when that fails too.
+        Messages the BODYSTRUCTURE probe shows to have no attachments are
+        queued with ``_SKIPPED`` instead; ``accept`` (see _filename_filter)
+        also rules out messages whose attachments are all filtered out. A
+        final ``None`` marks the end of the stream.
+        """
+        size = max(1, min(bulk_size or self.BULK_FETCH_SIZE, self.BULK_FETCH_SIZE_MAX))
+        window_size = max(size, self.PROBE_BATCH_SIZE)
+        try:
+            for start in range(0, len(email_ids), window_size):
+                window = email_ids[start:start + window_size]
+                candidates = self._probe_attachments(window, accept)
+                wanted = window if candidates is None else [eid for eid in window if eid in candidates]
+                fetched: Dict[str, bytes] = {}
+                done = 0
+                for eid in window:
+                    if candidates is not None and eid not in candidates:
+                        if not self._queue_put(out_queue, (eid, _SKIPPED), stop):
+                            return
+                        continue
+                    if done % size == 0:
+                        # Fetch the next batch of candidates in a single round trip
+                        fetched = self._fetch_emails_bulk(wanted[done:done + size])
+                    done += 1
+                    raw_email = fetched.get(eid)
+                    if raw_email is None and not stop.is_set():
+                        raw_email = self._fetch_email(eid)
+                    if not self._queue_put(out_queue, (eid, raw_email), stop):
+                        return
+        finally:
+            self._queue_put(out_queue, None, stop)
+    
+    @staticmethod
+    def _queue_put(out_queue: queue.Queue, item, stop: threading.Event) -> bool:
+        """Put item on a bounded queue, giving up once stop is set."""
+        while not stop.is_set():
+            try:
+                out_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _load_seen(
+        self,
+        save_path: str,
+        email_ids: List[str]
+    ) -> Tuple[Optional[SeenMessages], Dict[str, str]]:
+        """
+        Load the messages extracted by earlier runs and map ids to UIDs.
+        
+        Args:
+            save_path: Directory holding the state file
+            email_ids: Message ids about to be processed
+            
+        Returns:
+            Tuple of (seen messages, id to UID mapping). The seen messages
+            are None when the server reported no UIDVALIDITY or the UIDs
+            could not be fetched; every message is processed then.
+        """
+        if self._uidvalidity is None or self._selected_mailbox is None:
+            print(Colors.warning("Server reported no UIDVALIDITY; processing all emails"))
+            return None, {}
+        
+        uids = self._fetch_uids(email_ids)
+        if uids is None:
+            print(Colors.warning("Could not fetch message UIDs; processing all emails"))
+            return None, {}
+        
+        seen = SeenMessages(save_path, self._selected_mailbox, self._uidvalidity)
+        known = sum(1 for eid in email_ids if uids.get(eid) in seen)
+        if known:
+            print(Colors.info(f"{known} email(s) already extracted in an earlier run"))
+        return seen, uids
+    
+    def _fetch_uids(self, email_ids: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Map message ids to UIDs via FETCH (UID) in windows of PROBE_BATCH_SIZE.
+        
+        Windowing keeps the command line short for sparse id lists. Ids of a
+        failed window get no UID: they are processed but not recorded.
+        
+        Args:
+            email_ids: Message ids to map
+            
+        Returns:
+            Mapping of email id to UID, or None if every window failed
+        """
+        uids: Dict[str, str] = {}
+        failed = 0
+        for start in range(0, len(email_ids), self.PROBE_BATCH_SIZE):
+            window = email_ids[start:start + self.PROBE_BATCH_SIZE]
+            window_uids = self._fetch_uid_window(window)
+            if window_uids is None:
+                failed += len(window)
+            else:
+                uids.update(window_uids)
+        if email_ids and failed == len(email_ids):
             return None
-        except Exception:
+        if failed:
+            print(Colors.warning(
+                f"Could not fetch UIDs for {failed} email(s); they are processed but not remembered"
+            ))
+        dprint(f"Fetched UIDs for {len(uids)}/{len(email_ids)} message(s)", tag="IMAP")
+        return uids
+    
+    def _fetch_uid_window(self, email_ids: List[str]) -> Optional[Dict[str, str]]:
+        """Map one window of message ids to UIDs with a single FETCH (UID)."""
+        try:
+            status, data = self.imap.fetch(_message_set(email_ids), '(UID)')
+            if status != 'OK':
+                dprint(f"UID FETCH failed (status={status})", tag="IMAP")
+                return None
+        except Exception as e:
+            dprint(f"UID FETCH error: {e}", tag="IMAP")
             return None
+        
+        uids: Dict[str, str] = {}
+        for item in data or []:
+            if isinstance(item, tuple):
+                item = item[0]
+            if isinstance(item, bytes):
+                match = _FETCH_UID_RE.match(item)
+                if match:
+                    uids[match.group(1).decode()] = match.group(2).decode()
+        return uids
+    
+    def _probe_attachments(
+        self,
+        email_ids: List[str],
+        accept: Optional[Callable[[str], bool]] = None
+    ) -> Optional[set]:
+        """
+        Find the messages that may have attachments via FETCH (BODYSTRUCTURE).
+        
+        BODYSTRUCTURE is a few hundred bytes per message, so probing first
+        avoids downloading the full body of messages without attachments.
+        
+        Args:
+            email_ids: Message ids to probe
+            accept: Optional attachment file name filter
+            
+        Returns:
+            Set of ids worth downloading, or None if the probe is disabled or
+            failed (everything should be downloaded then)
+        """
+        if not self.PROBE_BODYSTRUCTURE or not email_ids:
+            return None
+        try:
+            status, data = self.imap.fetch(_message_set(email_ids), '(BODYSTRUCTURE)')
+            if status != 'OK' or not data:
+                dprint(f"BODYSTRUCTURE probe failed (status={status})", tag="IMAP")
+                return None
+            candidates = messages_with_attachments(data, email_ids, accept)
+            if candidates is None:
+                dprint("BODYSTRUCTURE probe returned nothing usable", tag="IMAP")
+                return None
+            dprint(f"BODYSTRUCTURE probe: {len(candidates)}/{len(email_ids)} message(s) may have attachments", tag="IMAP")
+            return set(candidates)
+        except Exception as e:
+            dprint(f"BODYSTRUCTURE probe error: {e}", tag="IMAP")
+            return None
+    
+    @staticmethod
+    def _filename_filter(
+        allowed_extensions: Optional[List[str]],
+        excluded_extensions: Optional[List[str]]
+    ) -> Optional[Callable[[str], bool]]:
+        """
+        Build the file name check used by the BODYSTRUCTURE probe.
+        
+        Names are decoded and sanitized exactly as in
+        EmailProcessor._collect_attachments before the patterns are applied,
+        so a message is only skipped if none of its attachments would be saved.
+        
+        Returns:
+            Callable taking a raw file name, or None if no patterns are set
+        """
+        if not allowed_extensions and not excluded_extensions:
+            return None
+        
+        def accept(filename: str) -> bool:
+            name = sanitize_filename(EmailProcessor._decode_mime_string(filename))
+            return PatternMatcher.should_include_file(
+                name, allowed_extensions, excluded_extensions
+            )[0]
+        return accept
+    
+    def _fetch_emails_bulk(self, email_ids: List[str]) -> Dict[str, bytes]:
+        """
+        Fetch several emails with one FETCH command.
+        
+        The response interleaves ``(b'<id> (BODY[] {size}', b'<raw>')`` tuples
+        with closing ``b')'`` items; each tuple is mapped back to its id via
+        the leading message number. Ids missing from the result (or a failed
+        command) are left for the caller to fetch individually.
+        
+        Args:
+            email_ids: Message ids to fetch (at most BULK_FETCH_SIZE_MAX)
+            
+        Returns:
+            Mapping of email id to raw message bytes
+        """
+        if not email_ids:
+            return {}
+        
+        result: Dict[str, bytes] = {}
+        spec = self.FETCH_BODY_SPEC
+        try:
+            dprint(f"FETCH {len(email_ids)} message(s) [{email_ids[0]}..{email_ids[-1]}] using {spec}", tag="IMAP")
+            status, data = self.imap.fetch(_message_set(email_ids), spec)
+            if status != 'OK' or not data:
+                dprint(f"Bulk FETCH failed or empty (status={status})", tag="IMAP")
+                return result
+            
+            for item in data:
+                if not isinstance(item, tuple) or len(item) < 2:
+                    continue
+                header, body = item[0], item[1]
+                if not isinstance(header, (bytes, bytearray)) or not isinstance(body, (bytes, bytearray)):
+                    continue
+                match = _FETCH_ID_RE.match(header)
+                if match:
+                    result[match.group(1).decode('ascii')] = body
+            
+            dprint(f"Bulk FETCH returned {len(result)}/{len(email_ids)} message(s)", tag="IMAP")
+            
+        except Exception as e:
+            print(Colors.error(f"Error fetching emails {email_ids[0]}..{email_ids[-1]}: {e}"))
+        
+        return result
     
     def _fetch_email(self, email_id: str) -> Optional[bytes]:
         """
-        Fetch raw email data for the given id using the appropriate body
-        section for the provider. Some providers (e.g., iCloud) require
-        '(BODY[])' whereas generic IMAP servers typically support '(RFC822)'.
+        Fetch raw email data for the given id with FETCH_BODY_SPEC.
         Returns None when the fetch fails or the response cannot be parsed.
         """
         try:
-            # Special handling for iCloud
-            if 'imap.mail.me.com' in self.server:
-                dprint(f"FETCH {email_id} using BODY[] (iCloud)", tag="IMAP")
-                status, data = self.imap.fetch(email_id, '(BODY[])')
-            else:
-                dprint(f"FETCH {email_id} using RFC822", tag="IMAP")
-                status, data = self.imap.fetch(email_id, '(RFC822)')
+            spec = self.FETCH_BODY_SPEC
+            dprint(f"FETCH {email_id} using {spec}", tag="IMAP")
+            status, data = self.imap.fetch(email_id, spec)
             
             if status != 'OK' or not data:
                 dprint(f"FETCH {email_id} failed or empty (status={status})", tag="IMAP")
@@ -415,10 +1273,18 @@ class EmailAttachmentExtractor:
             return None
     
     def _filter_inbox_folders(self, mailboxes: List[str]) -> List[str]:
-        """Filter for INBOX and subfolders."""
+        """
+        Filter for INBOX and subfolders.
+        
+        Uses the hierarchy delimiter reported by LIST ('INBOX.Sub' on many
+        Courier/Dovecot setups) and leaves out \\Noselect folders.
+        """
+        prefix = 'INBOX' + self._mbox_delimiter
         inbox_folders = ['INBOX']
+        seen = {'INBOX'}
         for mb in mailboxes:
-            if mb.startswith('INBOX/') and mb not in inbox_folders:
+            if mb.startswith(prefix) and mb not in seen and mb not in self._noselect:
+                seen.add(mb)
                 inbox_folders.append(mb)
         return inbox_folders
     
@@ -441,13 +1307,24 @@ class EmailAttachmentExtractor:
         mailbox: str,
         save_path: str,
         processed_count: int,
+        preselected: bool = False,
         **kwargs
     ) -> int:
-        """Process a single mailbox and return updated count."""
+        """
+        Process a single mailbox and return updated count.
+        
+        With ``preselected`` the mailbox was already selected and searched
+        on this connection and the ids come in as ``email_ids`` (None if
+        the selection failed).
+        """
         print(Colors.info(f"\nProcessing mailbox: {mailbox}"))
         print("-" * 40)
         
-        if not self.select_mailbox(mailbox):
+        if preselected:
+            if kwargs.get('email_ids') is None:
+                print(Colors.warning(f"Skipping {mailbox} - could not select"))
+                return processed_count
+        elif not self.select_mailbox(mailbox):
             print(Colors.warning(f"Skipping {mailbox} - could not select"))
             return processed_count
         
@@ -467,6 +1344,147 @@ class EmailAttachmentExtractor:
         
         return processed_count + stats.get('emails_processed', 0)
     
+    def _select_and_search(
+        self,
+        mailbox: str,
+        search_criteria: str,
+        attachments_only: bool
+    ) -> Optional[List[str]]:
+        """Select a mailbox and search it; None if it cannot be selected."""
+        if not self.select_mailbox(mailbox):
+            return None
+        return self.search_emails(search_criteria, attachments_only=attachments_only)
+    
+    def _process_folders_sequential(
+        self,
+        folders: List[str],
+        save_path: str,
+        limit_per_folder: Optional[int],
+        total_limit: Optional[int],
+        standby: Optional['EmailAttachmentExtractor'] = None,
+        **kwargs
+    ):
+        """
+        Process folders one after another, honoring the total limit.
+        
+        With a standby connection the folders alternate between the two
+        connections: while one processes a folder, the other already runs
+        SELECT and SEARCH for the next one, hiding those round trips.
+        """
+        processed_count = 0
+        prefetcher = None
+        upcoming = None
+        connections = [self, standby]
+        if standby is not None and folders:
+            prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix='folder-prefetch')
+            upcoming = prefetcher.submit(
+                self._select_and_search, folders[0],
+                kwargs['search_criteria'], kwargs['attachments_only']
+            )
+        
+        try:
+            for i, folder in enumerate(folders):
+                if total_limit and processed_count >= total_limit:
+                    print(Colors.warning(f"\nTotal limit of {total_limit} emails reached"))
+                    break
+                
+                # Calculate effective limit for this folder
+                effective_limit = self._calculate_effective_limit(
+                    limit_per_folder, 
+                    total_limit, 
+                    processed_count
+                )
+                
+                if prefetcher is None:
+                    processed_count = self._process_mailbox(
+                        mailbox=folder,
+                        save_path=save_path,
+                        limit=effective_limit,
+                        processed_count=processed_count,
+                        **kwargs
+                    )
+                    continue
+                
+                email_ids = upcoming.result()
+                if i + 1 < len(folders):
+                    upcoming = prefetcher.submit(
+                        connections[(i + 1) % 2]._select_and_search, folders[i + 1],
+                        kwargs['search_criteria'], kwargs['attachments_only']
+                    )
+                processed_count = connections[i % 2]._process_mailbox(
+                    mailbox=folder,
+                    save_path=save_path,
+                    limit=effective_limit,
+                    processed_count=processed_count,
+                    preselected=True,
+                    email_ids=email_ids,
+                    **kwargs
+                )
+        finally:
+            if prefetcher is not None:
+                prefetcher.shutdown(wait=True)
+    
+    def _spawn_worker(self) -> 'EmailAttachmentExtractor':
+        """
+        Create an extractor for a worker thread.
+        
+        The worker owns its IMAP connection but shares statistics (and the
+        lock guarding them) with this instance.
+        """
+        worker = EmailAttachmentExtractor(
+            server=self.server,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_ssl=self.use_ssl
+        )
+        worker.statistics = self.statistics
+        worker._stats_lock = self._stats_lock
+        return worker
+    
+    def _process_folders_parallel(
+        self,
+        folders: List[str],
+        workers: int,
+        save_path: str,
+        **kwargs
+    ):
+        """
+        Process folders concurrently, one IMAP connection per worker thread.
+        
+        Each thread logs in once and reuses its connection for every folder
+        it picks up; all connections are closed when the pool is done.
+        """
+        dprint(f"Processing {len(folders)} folder(s) with {workers} parallel connection(s)", tag="RUN")
+        local = threading.local()
+        connected: List['EmailAttachmentExtractor'] = []
+        
+        def run(folder: str):
+            worker = getattr(local, 'worker', None)
+            if worker is None:
+                worker = self._spawn_worker()
+                if not worker.connect():
+                    with self._stats_lock:
+                        self._add_error(f"Could not open connection for {folder}")
+                    return
+                local.worker = worker
+                with self._stats_lock:
+                    connected.append(worker)
+            worker._process_mailbox(
+                mailbox=folder,
+                save_path=save_path,
+                processed_count=0,
+                **kwargs
+            )
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # Consume results so worker exceptions are raised here
+                list(pool.map(run, folders))
+        finally:
+            for worker in connected:
+                worker.disconnect()
+    
     def _save_metadata(self, save_path: str, attachments: List[Dict]):
         """Save metadata to JSON file."""
         metadata_file = os.path.join(save_path, 'attachments_metadata.json')
@@ -484,13 +1502,18 @@ class EmailAttachmentExtractor:
     def _save_total_metadata(self, save_path: str, folders: List[str]):
         """Save total metadata for all processed folders."""
         metadata_file = os.path.join(save_path, 'attachments_metadata_total.json')
+        data = {
+            'extraction_date': datetime.now().isoformat(),
+            'processed_folders': folders,
+            'statistics': self.statistics
+        }
         try:
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'extraction_date': datetime.now().isoformat(),
-                    'processed_folders': folders,
-                    'statistics': self.statistics
-                }, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                with open(metadata_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(metadata_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
             print(Colors.success(f"\nTotal metadata saved to: {metadata_file}"))
         except Exception as e:
             print(Colors.error(f"Error saving total metadata: {e}"))
@@ -504,9 +1527,11 @@ class EmailAttachmentExtractor:
         print(Colors.info(f"Attachments saved: {self.statistics['attachments_saved']}"))
         print(Colors.info(f"Total size: {self.statistics['total_size_mb']:.2f} MB"))
         
-        if self.statistics['errors']:
-            print(Colors.warning(f"\n{len(self.statistics['errors'])} error(s) occurred:"))
-            for err in self.statistics['errors'][:5]:
+        errors = self.statistics['errors']
+        if errors:
+            total = len(errors) + self.statistics.get('errors_dropped', 0)
+            print(Colors.warning(f"\n{total} error(s) occurred:"))
+            for err in errors[:5]:
                 print(Colors.error(f"   - {err}"))
-            if len(self.statistics['errors']) > 5:
-                print(Colors.warning(f"   ... and {len(self.statistics['errors']) - 5} more"))
+            if total > 5:
+                print(Colors.warning(f"   ... and {total - 5} more"))
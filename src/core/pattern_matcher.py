@@ -8,10 +8,49 @@ Supports Unix-style wildcards: *, ?, [seq], [!seq]
 """
 
 import fnmatch
-from typing import List, Optional, Dict, Tuple
+import functools
+import re
+from typing import List, Optional, Dict, Pattern, Tuple
 from pathlib import Path
 
 
+# Years 2000-2099 in filenames (used for pattern suggestions)
+_YEAR_RE = re.compile(r'20\d{2}')
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(
+    patterns: Tuple[Optional[str], ...]
+) -> Tuple[bool, Tuple[str, ...], Optional[Pattern]]:
+    """
+    Prepare a pattern list for matching lowercased filenames.
+    
+    The same allowed/excluded lists are checked for every attachment, so
+    they are normalized once: simple extensions become suffixes for
+    str.endswith and all wildcard patterns are joined into one regex.
+    
+    Returns:
+        Tuple of (matches everything, extension suffixes, wildcard regex)
+    """
+    match_all = False
+    suffixes: List[str] = []
+    wildcards: List[str] = []
+    
+    for pattern in patterns:
+        if pattern is None:
+            continue
+        pattern_lower = pattern.lower().strip()
+        if pattern_lower == '*':
+            match_all = True
+        elif not any(c in pattern_lower for c in '*?[]'):
+            suffixes.append(pattern_lower if pattern_lower.startswith('.') else '.' + pattern_lower)
+        else:
+            wildcards.append(fnmatch.translate(pattern_lower))
+    
+    regex = re.compile('|'.join(wildcards)) if wildcards else None
+    return match_all, tuple(suffixes), regex
+
+
 class PatternMatcher:
     """
     Pattern matching utility for filtering filenames based on wildcards.
@@ -44,37 +83,21 @@ class PatternMatcher:
         """
         if not patterns:
             return False
-            
+        
+        match_all, suffixes, regex = _compile_patterns(tuple(patterns))
+        
+        # Special case: "*" matches everything
+        if match_all:
+            return True
+        
         filename_lower = filename.lower()
         
-        for pattern in patterns:
-            if pattern is None:
-                continue
-                
-            pattern_lower = pattern.lower().strip()
-            
-            # Special case: "*" matches everything
-            if pattern_lower == '*':
-                return True
-            
-            # Case 1: Simple extension without wildcards (e.g., "pdf", ".pdf")
-            if not any(c in pattern_lower for c in ['*', '?', '[', ']']):
-                # Normalize extension
-                if not pattern_lower.startswith('.'):
-                    ext_pattern = '.' + pattern_lower
-                else:
-                    ext_pattern = pattern_lower
-                    
-                # Check if filename ends with this extension
-                if filename_lower.endswith(ext_pattern):
-                    return True
-            
-            # Case 2: Pattern contains wildcards - use fnmatch
-            else:
-                if fnmatch.fnmatch(filename_lower, pattern_lower):
-                    return True
-                    
-        return False
+        # Simple extensions without wildcards (e.g., "pdf", ".pdf")
+        if suffixes and filename_lower.endswith(suffixes):
+            return True
+        
+        # Wildcard patterns, combined into one regex
+        return regex is not None and regex.match(filename_lower) is not None
     
     @staticmethod
     def filter_files(
@@ -319,12 +342,10 @@ class PatternMatcher:
                 suggestions['prefixes'].append(f'{prefix}*')
         
         # Suggest year-based patterns if applicable
-        import re
-        year_pattern = re.compile(r'20\d{2}')
         years_found = set()
         
         for filename in filenames:
-            matches = year_pattern.findall(filename)
+            matches = _YEAR_RE.findall(filename)
             years_found.update(matches)
         
         if len(years_found) > 1:
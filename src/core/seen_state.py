@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seen Messages Module
+
+Remembers which messages were already extracted so repeated runs into the
+same save directory only download new mail. Messages are identified by
+IMAP UID together with the mailbox's UIDVALIDITY; when the server reports
+a different UIDVALIDITY the old entries no longer apply.
+"""
+
+import json
+import os
+from typing import Optional, Set
+
+from ..utils.colors import Colors
+
+
+# State file kept in the save directory (one JSON object per line)
+STATE_FILE_NAME = '.extractor_state.jsonl'
+
+
+class SeenMessages:
+    """
+    UIDs of one mailbox that were extracted by earlier runs.
+
+    New UIDs are appended to the state file as soon as their message has
+    been handled, so an interrupted run keeps its progress.
+    """
+
+    def __init__(self, save_path: str, mailbox: str, uidvalidity: int):
+        """
+        Load the UIDs recorded for mailbox under the given UIDVALIDITY.
+
+        Args:
+            save_path: Directory holding the state file
+            mailbox: Mailbox name
+            uidvalidity: UIDVALIDITY reported when selecting the mailbox
+        """
+        self.path = os.path.join(save_path, STATE_FILE_NAME)
+        self.mailbox = mailbox
+        self.uidvalidity = uidvalidity
+        self.uids: Set[str] = set()
+        self._fh = None
+        self._load()
+
+    def _load(self):
+        """Read the UIDs for this mailbox from the state file, if any."""
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Partial line from an interrupted run
+                        continue
+                    if (isinstance(record, dict)
+                            and record.get('mailbox') == self.mailbox
+                            and record.get('uidvalidity') == self.uidvalidity):
+                        self.uids.add(str(record.get('uid')))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(Colors.warning(f"Could not read state file {self.path}: {e}"))
+
+    def __contains__(self, uid: Optional[str]) -> bool:
+        return uid is not None and uid in self.uids
+
+    def __len__(self) -> int:
+        return len(self.uids)
+
+    def add(self, uid: Optional[str]):
+        """Record uid as extracted."""
+        if uid is None or uid in self.uids:
+            return
+        self.uids.add(uid)
+        record = {'mailbox': self.mailbox, 'uidvalidity': self.uidvalidity, 'uid': uid}
+        try:
+            if self._fh is None:
+                self._fh = open(self.path, 'a', encoding='utf-8')
+            self._fh.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self._fh.flush()
+        except OSError as e:
+            print(Colors.error(f"Error saving state: {e}"))
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
@@ -6,6 +6,7 @@ from .colors import Colors
 from .filesystem import (
     sanitize_filename,
     get_unique_filename,
+    get_existing_filenames,
     get_available_drives,
     create_directory
 )
@@ -20,6 +21,7 @@ __all__ = [
     "Colors",
     "sanitize_filename",
     "get_unique_filename",
+    "get_existing_filenames",
     "get_available_drives",
     "create_directory",
     "ConfigLoader",
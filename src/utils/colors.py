@@ -8,11 +8,19 @@ Automatically handles Windows terminal compatibility.
 """
 
 import platform
+import re
 import sys
 import os
 from typing import Optional, Any, Callable
 
 
+# The OS cannot change while running; look it up once
+_SYSTEM = platform.system()
+
+# ANSI SGR escape sequences (colors and text styles)
+_ANSI_ESCAPE_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
 class Colors:
     """
     Cross-platform color codes for terminal output.
@@ -63,6 +71,10 @@ class Colors:
     # Reset
     RESET = '\033[0m'
     
+    # Escape prefixes of the convenience methods, joined once
+    _ERROR_PREFIX = RED + BOLD
+    _DEBUG_PREFIX = GRAY + DIM
+    
     # Class variable to track if colors are enabled
     _enabled = True
     _initialized = False
@@ -89,11 +101,11 @@ class Colors:
             return
         
         # Platform-specific initialization
-        if platform.system() == 'Windows':
+        if _SYSTEM == 'Windows':
             cls._initialize_windows()
         
         # Check for TERM environment variable on Unix-like systems
-        elif platform.system() in ['Linux', 'Darwin']:
+        elif _SYSTEM in ('Linux', 'Darwin'):
             term = os.environ.get('TERM', '')
             if term == 'dumb':
                 cls._enabled = False
@@ -157,15 +169,20 @@ class Colors:
         Returns:
             Colorized string or original text
         """
+        if not codes:
+            if not cls._initialized:
+                cls._initialize()
+            return str(text)
+        return cls._wrap(text, ''.join(codes))
+    
+    @classmethod
+    def _wrap(cls, text: Any, prefix: str) -> str:
+        """Wrap text in a ready-made escape prefix and RESET if colors are enabled."""
         if not cls._initialized:
             cls._initialize()
-            
-        text = str(text)
-        
-        if not cls._enabled or not codes:
-            return text
-            
-        return ''.join(codes) + text + cls.RESET
+        if not cls._enabled:
+            return str(text)
+        return f'{prefix}{text}{cls.RESET}'
     
     @classmethod
     def error(cls, text: Any) -> str:
@@ -178,7 +195,7 @@ class Colors:
         Returns:
             Red colored text
         """
-        return cls._colorize(text, cls.RED, cls.BOLD)
+        return cls._wrap(text, cls._ERROR_PREFIX)
     
     @classmethod
     def success(cls, text: Any) -> str:
@@ -191,7 +208,7 @@ class Colors:
         Returns:
             Green colored text
         """
-        return cls._colorize(text, cls.GREEN)
+        return cls._wrap(text, cls.GREEN)
     
     @classmethod
     def warning(cls, text: Any) -> str:
@@ -204,7 +221,7 @@ class Colors:
         Returns:
             Yellow colored text
         """
-        return cls._colorize(text, cls.YELLOW)
+        return cls._wrap(text, cls.YELLOW)
     
     @classmethod
     def info(cls, text: Any) -> str:
@@ -217,7 +234,7 @@ class Colors:
         Returns:
             Cyan colored text
         """
-        return cls._colorize(text, cls.CYAN)
+        return cls._wrap(text, cls.CYAN)
     
     @classmethod
     def debug(cls, text: Any) -> str:
@@ -230,7 +247,7 @@ class Colors:
         Returns:
             Gray colored text
         """
-        return cls._colorize(text, cls.GRAY, cls.DIM)
+        return cls._wrap(text, cls._DEBUG_PREFIX)
     
     @classmethod
     def bold(cls, text: Any) -> str:
@@ -243,7 +260,7 @@ class Colors:
         Returns:
             Bold text
         """
-        return cls._colorize(text, cls.BOLD)
+        return cls._wrap(text, cls.BOLD)
     
     @classmethod
     def underline(cls, text: Any) -> str:
@@ -256,7 +273,7 @@ class Colors:
         Returns:
             Underlined text
         """
-        return cls._colorize(text, cls.UNDERLINE)
+        return cls._wrap(text, cls.UNDERLINE)
     
     @classmethod
     def cyan(cls, text: Any) -> str:
@@ -269,19 +286,19 @@ class Colors:
         Returns:
             Cyan colored text
         """
-        return cls._colorize(text, cls.CYAN)
+        return cls._wrap(text, cls.CYAN)
     
     @classmethod
     def red(cls, text: Any) -> str:
-        return cls._colorize(text, cls.RED)
+        return cls._wrap(text, cls.RED)
 
     @classmethod
     def yellow(cls, text: Any) -> str:
-        return cls._colorize(text, cls.YELLOW)
+        return cls._wrap(text, cls.YELLOW)
 
     @classmethod
     def green(cls, text: Any) -> str:
-        return cls._colorize(text, cls.GREEN)
+        return cls._wrap(text, cls.GREEN)
     
     @classmethod
     def custom(cls, text: Any, fg: Optional[str] = None, 
@@ -319,9 +336,7 @@ class Colors:
         Returns:
             Plain text without color codes
         """
-        import re
-        ansi_escape = re.compile(r'\x1b\[[0-9;]*m')
-        return ansi_escape.sub('', text)
+        return _ANSI_ESCAPE_RE.sub('', text)
     
     @classmethod
     def print_colored(cls, text: Any, color_func: callable = None):
@@ -434,7 +449,7 @@ def test_colors():
         print(Colors._colorize(f"  {name} text", color))
     
     print("\nColors enabled:", Colors.is_enabled())
-    print("Platform:", platform.system())
+    print("Platform:", _SYSTEM)
     
     # Test progress indicator
     print("\nTesting progress indicator:")
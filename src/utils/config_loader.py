@@ -7,15 +7,36 @@ Handles loading, validation, and merging of configuration from JSON files
 and command-line arguments.
 """
 
+import copy
+import functools
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import getpass
 
+try:
+    # Optional OS credential store (macOS Keychain, Windows Credential
+    # Locker, Secret Service) for the IMAP password
+    import keyring
+except ImportError:
+    keyring = None
+
 from .colors import Colors
 
 
+# Service name under which passwords are kept in the system keyring
+KEYRING_SERVICE = 'email-attachment-extractor'
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON config file; mtime and size only key the cache."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class ConfigLoader:
     """
     Loads and validates configuration for the email attachment extractor.
@@ -27,15 +48,23 @@ class ConfigLoader:
         'use_ssl': True,
         'mailbox': 'INBOX',
         'search_criteria': 'ALL',
+        'attachments_only': False,
         'organize_by_sender': False,
         'organize_by_date': True,
         'save_metadata': True,
+        'json_pretty': False,
+        'deduplicate': False,
+        'incremental': False,
+        'subscribed_only': False,
         'save_path': None,
         'log_file': None,
         'limit': None,
         'recursive': False,
         'limit_per_folder': None,
         'total_limit': None,
+        'folder_workers': 1,
+        'parse_workers': 1,
+        'bulk_size': 100,
         'allowed_extensions': None,
         'excluded_extensions': None
     }
@@ -43,6 +72,55 @@ class ConfigLoader:
     # Required fields that must be present
     REQUIRED_FIELDS = ['server', 'username']
     
+    # Where prompt_for_password got the password: 'keyring', 'prompt', or
+    # None if it was configured
+    password_source: Optional[str] = None
+    
+    # Boolean fields (non-booleans are converted during validation)
+    BOOL_FIELDS = ('use_ssl', 'organize_by_sender', 'organize_by_date',
+                   'save_metadata', 'recursive', 'attachments_only', 'json_pretty',
+                   'deduplicate', 'incremental', 'subscribed_only')
+    
+    # Optional positive integer fields
+    INT_FIELDS = ('limit', 'limit_per_folder', 'total_limit', 'folder_workers',
+                  'parse_workers', 'bulk_size')
+    
+    # Command-line arguments copied into the config: (argument, config key,
+    # accepted types). Other types (e.g. bare Mock objects) are ignored.
+    _ARG_FIELDS = (
+        ('server', 'server', str),
+        ('port', 'port', int),
+        ('username', 'username', str),
+        ('password', 'password', (str, type(None))),
+        ('save_path', 'save_path', str),
+        ('log_file', 'log_file', (str, type(None))),
+        ('mailbox', 'mailbox', str),
+        ('search_criteria', 'search_criteria', str),
+        ('limit', 'limit', int),
+        ('recursive', 'recursive', bool),
+        ('limit_per_folder', 'limit_per_folder', int),
+        ('total_limit', 'total_limit', int),
+        ('folder_workers', 'folder_workers', int),
+        ('parse_workers', 'parse_workers', int),
+        ('bulk_size', 'bulk_size', int),
+    )
+    
+    # Integer arguments that may arrive as numeric strings
+    _NUMERIC_ARGS = frozenset(('port',) + INT_FIELDS)
+    
+    # Flags that set a config value when given: (argument, config key,
+    # value, whether the argument must be literally True)
+    _FLAG_ARGS = (
+        ('organize_by_sender', 'organize_by_sender', True, False),
+        ('organize_by_date', 'organize_by_date', True, False),
+        ('attachments_only', 'attachments_only', True, True),
+        ('no_metadata', 'save_metadata', False, False),
+        ('json_pretty', 'json_pretty', True, True),
+        ('deduplicate', 'deduplicate', True, True),
+        ('incremental', 'incremental', True, True),
+        ('subscribed_only', 'subscribed_only', True, True),
+    )
+    
     @classmethod
     def load_config(cls, config_file: str) -> Optional[Dict]:
         """
@@ -59,8 +137,11 @@ class ConfigLoader:
                 print(Colors.error(f"Configuration file '{config_file}' not found"))
                 return None
             
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            # Re-read only when the file changed since the last load;
+            # callers mutate the result, so hand out a private copy
+            st = os.stat(config_file)
+            config = copy.deepcopy(_read_config_file(
+                os.path.abspath(config_file), st.st_mtime_ns, st.st_size))
             
             print(Colors.success(f"Configuration loaded from: {config_file}"))
             return config
@@ -99,16 +180,13 @@ class ConfigLoader:
                 return False
         
         # Validate boolean fields
-        bool_fields = ['use_ssl', 'organize_by_sender', 'organize_by_date', 
-                      'save_metadata', 'recursive']
-        for field in bool_fields:
+        for field in cls.BOOL_FIELDS:
             if field in config and not isinstance(config[field], bool):
                 print(Colors.warning(f"Field '{field}' should be boolean, converting..."))
                 config[field] = bool(config[field])
         
         # Validate integer fields
-        int_fields = ['limit', 'limit_per_folder', 'total_limit']
-        for field in int_fields:
+        for field in cls.INT_FIELDS:
             if field in config and config[field] is not None:
                 if not isinstance(config[field], int) or config[field] < 1:
                     print(Colors.error(f"Invalid {field}: must be positive integer"))
@@ -170,46 +248,14 @@ class ConfigLoader:
         Returns:
             Merged configuration
         """
-        # Direct field mappings
-        field_mappings = {
-            'server': 'server',
-            'port': 'port',
-            'username': 'username',
-            'password': 'password',
-            'save_path': 'save_path',
-            'log_file': 'log_file',
-            'mailbox': 'mailbox',
-            'search_criteria': 'search_criteria',
-            'limit': 'limit',
-            'recursive': 'recursive',
-            'limit_per_folder': 'limit_per_folder',
-            'total_limit': 'total_limit'
-        }
-        
-        # Expected types for sanity-checking Mock/default values
-        expected_types = {
-            'server': str,
-            'port': int,
-            'username': str,
-            'password': (str, type(None)),
-            'save_path': str,
-            'log_file': (str, type(None)),
-            'mailbox': str,
-            'search_criteria': str,
-            'limit': int,
-            'recursive': bool,
-            'limit_per_folder': int,
-            'total_limit': int,
-        }
-
-        for arg_name, config_name in field_mappings.items():
+        for arg_name, config_name, exp_type in cls._ARG_FIELDS:
             # Safely get value; Mock objects often fabricate attributes
             value = getattr(args, arg_name, None)
             if value is None:
                 continue
 
             # Coerce common CLI string numerics where appropriate
-            if config_name in ('port', 'limit', 'limit_per_folder', 'total_limit') and isinstance(value, str):
+            if config_name in cls._NUMERIC_ARGS and isinstance(value, str):
                 if value.isdigit():
                     value = int(value)
                 else:
@@ -217,8 +263,7 @@ class ConfigLoader:
                     continue
 
             # Only accept values of expected type to avoid Mock leakage
-            exp_type = expected_types.get(config_name)
-            if exp_type is not None and not isinstance(value, exp_type):
+            if not isinstance(value, exp_type):
                 # For booleans, allow truthy/falsey coercion explicitly
                 if config_name == 'recursive':
                     value = bool(value)
@@ -229,12 +274,10 @@ class ConfigLoader:
             config[config_name] = value
         
         # Boolean flags
-        if hasattr(args, 'organize_by_sender') and args.organize_by_sender:
-            config['organize_by_sender'] = True
-        if hasattr(args, 'organize_by_date') and args.organize_by_date:
-            config['organize_by_date'] = True
-        if hasattr(args, 'no_metadata') and args.no_metadata:
-            config['save_metadata'] = False
+        for arg_name, config_name, flag_value, strict in cls._FLAG_ARGS:
+            given = getattr(args, arg_name, None)
+            if (given is True) if strict else given:
+                config[config_name] = flag_value
         
         # File types (extensions)
         if hasattr(args, 'file_types'):
@@ -253,20 +296,76 @@ class ConfigLoader:
         """
         Prompt for password if not in configuration.
         
+        A password stored in the system keyring (if the optional keyring
+        package is installed) is used without prompting.
+        
         Args:
             config: Configuration dictionary
             
         Returns:
             Configuration with password
         """
+        cls.password_source = None
         if not config.get('password'):
             username = config.get('username', 'user')
-            config['password'] = getpass.getpass(
-                Colors.cyan(f"Password for {username}: ")
-            )
+            stored = cls._keyring_password(username)
+            if stored:
+                config['password'] = stored
+                cls.password_source = 'keyring'
+                print(Colors.info(f"Using password for {username} from the system keyring"))
+            else:
+                config['password'] = getpass.getpass(
+                    Colors.cyan(f"Password for {username}: ")
+                )
+                cls.password_source = 'prompt'
         
         return config
     
+    @staticmethod
+    def _keyring_password(username: str) -> Optional[str]:
+        """Look up username's password in the system keyring, if available."""
+        if keyring is None:
+            return None
+        try:
+            return keyring.get_password(KEYRING_SERVICE, username)
+        except Exception as e:
+            # No usable backend (e.g. headless Linux without Secret Service)
+            print(Colors.warning(f"Could not read the system keyring: {e}"))
+            return None
+    
+    @classmethod
+    def remember_password(cls, config: Dict) -> bool:
+        """
+        Offer to store a prompted password in the system keyring.
+        
+        Meant to be called after the password was accepted by the server,
+        so later runs (e.g. scheduled ones) need no prompt.
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            True if the password was stored, False otherwise
+        """
+        if keyring is None or cls.password_source != 'prompt' or not sys.stdin.isatty():
+            return False
+        
+        username = config.get('username', 'user')
+        answer = input(Colors.cyan(
+            f"Store the password for {username} in the system keyring? (y/n): "
+        )).strip().lower()
+        if answer != 'y':
+            return False
+        
+        try:
+            keyring.set_password(KEYRING_SERVICE, username, config['password'])
+            cls.password_source = 'keyring'
+            print(Colors.success("Password stored in the system keyring"))
+            return True
+        except Exception as e:
+            print(Colors.warning(f"Could not store password in the system keyring: {e}"))
+            return False
+    
     @classmethod
     def save_config(cls, config: Dict, filepath: str, 
                    include_password: bool = False) -> bool:
@@ -320,17 +419,24 @@ class ConfigLoader:
             "use_ssl": True,
             "mailbox": "INBOX",
             "search_criteria": "ALL",
+            "attachments_only": False,
             "organize_by_sender": False,
             "organize_by_date": True,
             "save_path": "./attachments",
             "log_file": None,
             "limit": 100,
             "save_metadata": True,
+            "json_pretty": False,
+            "deduplicate": False,
+            "incremental": False,
             "allowed_extensions": ["pdf", "*.doc*", "*.xls*"],
             "excluded_extensions": ["exe", "bat", "*.tmp"],
             "recursive": False,
             "limit_per_folder": None,
-            "total_limit": None
+            "total_limit": None,
+            "folder_workers": 1,
+            "parse_workers": 1,
+            "bulk_size": 100
         }
     
     @classmethod
@@ -64,8 +64,8 @@ def dump_config(config: Dict[str, Any]) -> None:
     # Compose readable lines (avoid dumping huge structures)
     keys_of_interest = [
         'server', 'port', 'use_ssl', 'username', 'password', 'mailbox',
-        'search_criteria', 'recursive', 'limit', 'limit_per_folder',
-        'total_limit', 'save_metadata', 'organize_by_sender', 'organize_by_date',
+        'search_criteria', 'attachments_only', 'recursive', 'subscribed_only', 'limit', 'limit_per_folder',
+        'total_limit', 'folder_workers', 'parse_workers', 'bulk_size', 'save_metadata', 'json_pretty', 'deduplicate', 'incremental', 'organize_by_sender', 'organize_by_date',
         'allowed_extensions', 'excluded_extensions', 'save_path',
     ]
     dprint("Effective configuration:", tag="CFG")
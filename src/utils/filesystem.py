@@ -7,16 +7,37 @@ Cross-platform filesystem operations for the email attachment extractor.
 """
 
 import os
-import re
 import platform
 import shutil
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Set, Tuple
 from datetime import datetime
 
 from .colors import Colors
 
 
+# Translation table used by sanitize_filename:
+# - Windows: < > : " / \ | ? * and ASCII 0-31 are invalid
+# - Unix/Linux/macOS: mainly / and null
+# Most invalid characters become '_'; '*' is dropped entirely because it
+# commonly appears in glob patterns.
+_SANITIZE_TABLE = str.maketrans(
+    {**{c: '_' for c in '<>:"/\\|?'}, **{chr(i): '_' for i in range(32)}, '*': None}
+)
+
+# The OS cannot change while running; look it up once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == 'Windows'
+_IS_DARWIN = _SYSTEM == 'Darwin'
+
+# Device names Windows refuses as file names (with or without extension)
+_WINDOWS_RESERVED_NAMES = frozenset(
+    ['CON', 'PRN', 'AUX', 'NUL']
+    + [f'COM{i}' for i in range(1, 10)]
+    + [f'LPT{i}' for i in range(1, 10)]
+)
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename for safe use across Windows, macOS, and Linux.
@@ -37,26 +58,16 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return 'unnamed'
     
-    # Remove or replace invalid characters for all platforms
-    # Windows: < > : " / \ | ? * and ASCII 0-31
-    # Unix/Linux/macOS: mainly / and null
-    # Strategy:
-    # - Replace most invalids with '_'
-    # - Remove '*' entirely (commonly appears in glob patterns)
-    filename = re.sub(r'[<>:"/\\|?\x00-\x1F]', '_', filename)
-    filename = filename.replace('*', '')
+    # Replace or remove invalid characters for all platforms
+    filename = filename.translate(_SANITIZE_TABLE)
     
     # Remove leading/trailing spaces and dots
     filename = filename.strip().strip('.')
     
     # Handle Windows reserved names
-    if platform.system() == 'Windows':
-        reserved = ['CON', 'PRN', 'AUX', 'NUL']
-        reserved += [f'COM{i}' for i in range(1, 10)]
-        reserved += [f'LPT{i}' for i in range(1, 10)]
-        
+    if _IS_WINDOWS:
         name_without_ext = filename.split('.')[0].upper()
-        if name_without_ext in reserved:
+        if name_without_ext in _WINDOWS_RESERVED_NAMES:
             filename = f'_{filename}'
     
     # Limit filename length (255 on most systems). Be conservative here
@@ -70,21 +81,63 @@ def sanitize_filename(filename: str) -> str:
     return filename or 'unnamed'
 
 
-def get_unique_filename(directory: str, filename: str) -> str:
+def _filename_key(filename: str) -> str:
+    """Normalize a filename for collision checks (case-insensitive on Windows/macOS)."""
+    if _IS_WINDOWS or _IS_DARWIN:
+        return filename.casefold()
+    return filename
+
+
+def get_existing_filenames(directory: str) -> Set[str]:
+    """
+    List the entries of a directory for use with get_unique_filename.
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        Set of normalized entry names (empty if the directory is missing)
+    """
+    try:
+        return {_filename_key(name) for name in os.listdir(directory)}
+    except OSError:
+        return set()
+
+
+def get_unique_filename(
+    directory: str,
+    filename: str,
+    existing_names: Optional[Set[str]] = None
+) -> str:
     """
     Generate a unique filename if the file already exists.
     
+    When `existing_names` (from get_existing_filenames) is given, collisions
+    are checked against that set instead of the filesystem, and the chosen
+    name is added to it so later calls in the same batch avoid it as well.
+    
     Args:
         directory: Directory where file will be saved
         filename: Desired filename
+        existing_names: Optional pre-listed names of the directory
         
     Returns:
         Unique filename (original or with number suffix)
     """
-    filepath = os.path.join(directory, filename)
+    if existing_names is None:
+        def exists(candidate: str) -> bool:
+            return os.path.exists(os.path.join(directory, candidate))
+    else:
+        def exists(candidate: str) -> bool:
+            return _filename_key(candidate) in existing_names
+    
+    def claim(candidate: str) -> str:
+        if existing_names is not None:
+            existing_names.add(_filename_key(candidate))
+        return candidate
     
-    if not os.path.exists(filepath):
-        return filename
+    if not exists(filename):
+        return claim(filename)
     
     # Split name and extension
     name, ext = os.path.splitext(filename)
@@ -92,16 +145,15 @@ def get_unique_filename(directory: str, filename: str) -> str:
     
     while True:
         candidate = f"{name}_{counter}{ext}"
-        candidate_path = os.path.join(directory, candidate)
-        if not os.path.exists(candidate_path):
-            return candidate
+        if not exists(candidate):
+            return claim(candidate)
         counter += 1
         
         # Safety check to avoid infinite loop
         if counter > 9999:
             # Use timestamp as last resort
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            return f"{name}_{timestamp}{ext}"
+            return claim(f"{name}_{timestamp}{ext}")
 
 
 def create_directory(path: str) -> bool:
@@ -146,12 +198,11 @@ def get_available_drives() -> Optional[str]:
     Returns:
         Selected drive path or None if cancelled
     """
-    system = platform.system()
     volumes = []
     
-    if system == 'Darwin':  # macOS
+    if _IS_DARWIN:  # macOS
         volumes = _get_macos_volumes()
-    elif system == 'Windows':
+    elif _IS_WINDOWS:
         volumes = _get_windows_drives()
     else:  # Linux and other Unix-like systems
         volumes = _get_linux_mounts()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for BODYSTRUCTURE parsing and attachment detection.
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.bodystructure import (
+    parse_fetch_response,
+    may_have_attachments,
+    messages_with_attachments,
+)
+
+
+TEXT_ONLY = b'1 (BODYSTRUCTURE ("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 12 1 NIL NIL NIL NIL))'
+
+ALTERNATIVE = (
+    b'2 (BODYSTRUCTURE (("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 12 1 NIL NIL NIL NIL)'
+    b'("TEXT" "HTML" ("CHARSET" "utf-8") NIL NIL "7BIT" 40 2 NIL NIL NIL NIL)'
+    b' "ALTERNATIVE" ("BOUNDARY" "x") NIL NIL NIL))'
+)
+
+WITH_ATTACHMENT = (
+    b'3 (BODYSTRUCTURE (("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 12 1 NIL NIL NIL NIL)'
+    b'("APPLICATION" "PDF" NIL NIL NIL "BASE64" 2048 NIL ("ATTACHMENT" ("FILENAME" "r.pdf")) NIL NIL)'
+    b' "MIXED" ("BOUNDARY" "y") NIL NIL NIL))'
+)
+
+
+def test_parse_plain_responses():
+    structures = parse_fetch_response([TEXT_ONLY, WITH_ATTACHMENT])
+    assert set(structures) == {'1', '3'}
+    assert structures['1'][0] == 'TEXT'
+    assert structures['1'][2] == ['CHARSET', 'utf-8']
+
+
+def test_parse_response_with_literal():
+    # imaplib splits literals into (prefix, literal) tuples
+    data = [
+        (b'4 (UID 9 BODYSTRUCTURE ("APPLICATION" "OCTET-STREAM" ("NAME" {7}', b'a b.bin'),
+        b') NIL NIL "BASE64" 10 NIL NIL NIL NIL))',
+    ]
+    structures = parse_fetch_response(data)
+    assert structures['4'][2] == ['NAME', 'a b.bin']
+
+
+def test_text_only_messages_have_no_attachments():
+    structures = parse_fetch_response([TEXT_ONLY, ALTERNATIVE])
+    assert may_have_attachments(structures['1']) is False
+    assert may_have_attachments(structures['2']) is False
+
+
+def test_attachment_detected_by_disposition_or_name():
+    structures = parse_fetch_response([WITH_ATTACHMENT])
+    assert may_have_attachments(structures['3']) is True
+
+    named = ['IMAGE', 'PNG', ['NAME', 'x.png'], None, None, 'BASE64', '10', None, None, None, None]
+    assert may_have_attachments(named) is True
+
+
+def test_missing_extension_data_is_conservative():
+    # Without disposition info an attachment cannot be ruled out
+    assert may_have_attachments(['APPLICATION', 'PDF', None, None, None, 'BASE64', '10']) is True
+
+
+def test_messages_with_attachments_filters_ids():
+    data = [TEXT_ONLY, ALTERNATIVE, WITH_ATTACHMENT]
+    assert messages_with_attachments(data, ['1', '2', '3', '5']) == ['3', '5']
+    assert messages_with_attachments([b')'], ['1']) is None
+
+
+def test_accept_filter_rules_out_unwanted_attachments():
+    structure = parse_fetch_response([WITH_ATTACHMENT])['3']
+    assert may_have_attachments(structure, lambda name: name.endswith('.pdf')) is True
+    assert may_have_attachments(structure, lambda name: name.endswith('.jpg')) is False
+
+    # Disposition filename wins over the Content-Type name, like get_filename()
+    both = ['IMAGE', 'PNG', ['NAME', 'x.png'], None, None, 'BASE64', '10', None,
+            ['INLINE', ['FILENAME', 'x.pdf']], None, None]
+    assert may_have_attachments(both, lambda name: name == 'x.pdf') is True
+    assert may_have_attachments(both, lambda name: name == 'x.png') is False
+
+    # RFC 2231 names are left to the full parse
+    extended = ['APPLICATION', 'PDF', None, None, None, 'BASE64', '10', None,
+                ['ATTACHMENT', ['FILENAME*', "utf-8''r%C3%A9.pdf"]], None, None]
+    assert may_have_attachments(extended, lambda name: False) is True
+
+    data = [TEXT_ONLY, WITH_ATTACHMENT]
+    assert messages_with_attachments(data, ['1', '3'], lambda name: False) == []
@@ -38,6 +38,29 @@ class TestConfigLoader:
         finally:
             os.unlink(temp_file)
     
+    def test_load_config_cached_until_file_changes(self):
+        """Test that unchanged files are parsed once and copies are returned."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"server": "a", "username": "u"}, f)
+            temp_file = f.name
+        
+        try:
+            with patch('src.utils.config_loader.json.load', wraps=json.load) as spy:
+                first = ConfigLoader.load_config(temp_file)
+                first['server'] = 'mutated'
+                second = ConfigLoader.load_config(temp_file)
+                assert second['server'] == 'a'
+                assert spy.call_count == 1
+                
+                with open(temp_file, 'w') as f:
+                    json.dump({"server": "changed", "username": "u"}, f)
+                st = os.stat(temp_file)
+                os.utime(temp_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+                assert ConfigLoader.load_config(temp_file)['server'] == 'changed'
+                assert spy.call_count == 2
+        finally:
+            os.unlink(temp_file)
+    
     def test_validate_config_required_fields(self):
         """Test validation of required fields."""
         # Missing required fields
@@ -124,6 +147,35 @@ class TestConfigLoader:
         assert config['password'] == "secret123"
         mock_getpass.assert_called_once()
     
+    def test_prompt_for_password_uses_keyring(self, monkeypatch):
+        """Test that a keyring password skips the prompt and prompted ones can be stored."""
+        from src.utils import config_loader
+        
+        class FakeKeyring:
+            def __init__(self):
+                self.stored = {}
+            
+            def get_password(self, service, username):
+                return self.stored.get((service, username))
+            
+            def set_password(self, service, username, password):
+                self.stored[(service, username)] = password
+        
+        fake = FakeKeyring()
+        monkeypatch.setattr(config_loader, 'keyring', fake)
+        monkeypatch.setattr('sys.stdin.isatty', lambda: True, raising=False)
+        monkeypatch.setattr('builtins.input', lambda *args: 'y')
+        
+        with patch('getpass.getpass', return_value='typed') as mock_getpass:
+            config = ConfigLoader.prompt_for_password({"username": "me"})
+            assert config['password'] == 'typed'
+            assert ConfigLoader.remember_password(config) is True
+            
+            config = ConfigLoader.prompt_for_password({"username": "me"})
+            assert config['password'] == 'typed'
+            assert ConfigLoader.password_source == 'keyring'
+            mock_getpass.assert_called_once()
+    
     def test_save_config_with_password(self):
         """Test saving configuration with password."""
         with tempfile.TemporaryDirectory() as tmpdir:
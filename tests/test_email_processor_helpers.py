@@ -7,12 +7,14 @@ Additional tests for EmailProcessor helper methods and summary.
 import sys
 import os
 import tempfile
+import email
 from email.message import EmailMessage
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.email_processor import EmailProcessor
+from src.core.pattern_matcher import PatternMatcher
 
 
 def test_decode_mime_string_and_sender_extraction():
@@ -20,6 +22,15 @@ def test_decode_mime_string_and_sender_extraction():
     s = '=?utf-8?q?Hello_=C3=84?='
     assert EmailProcessor._decode_mime_string(s) == 'Hello Ä'
 
+    # Plain headers skip decode_header but still get unfolded
+    assert EmailProcessor._decode_mime_string('Quarterly report') == 'Quarterly report'
+    assert EmailProcessor._decode_mime_string('Quarterly\r\n report') == 'Quarterly report'
+
+    # Plain text next to encoded words keeps backslashes and non-ASCII text
+    s = 'Pfad C:\\users\\x =?utf-8?q?M=C3=A4rz?='
+    assert EmailProcessor._decode_mime_string(s) == 'Pfad C:\\users\\x März'
+    assert EmailProcessor._decode_mime_string('Grüße =?utf-8?q?M=C3=A4rz?=') == 'Grüße März'
+
     assert EmailProcessor._extract_sender_email('John <john@example.com>') == 'john@example.com'
     assert EmailProcessor._extract_sender_email('plain@example.com') == 'plain@example.com'
     assert EmailProcessor._extract_sender_email(None) == 'unknown'
@@ -69,3 +80,273 @@ def test_get_email_summary_and_attachment_saving(tmp_path):
     assert saved[0]['original_filename'] == 'report.pdf'
     assert os.path.exists(saved[0]['filepath'])
 
+
+
+def test_streamed_attachment_matches_in_memory_decode(tmp_path, monkeypatch):
+    import src.core.email_processor as ep
+    # Small chunks force many slices and partial base64 groups
+    monkeypatch.setattr(ep, 'ATTACHMENT_CHUNK_SIZE', 1000)
+
+    data = os.urandom(50_001)
+    msg = EmailMessage()
+    msg['From'] = 'bob@example.com'
+    msg['Subject'] = 'Data'
+    msg.set_content('see attachment')
+    msg.add_attachment(data, maintype='application', subtype='octet-stream', filename='blob.bin')
+
+    proc = EmailProcessor()
+    parsed = proc.parse_email(msg.as_bytes())
+    part = next(p for p in parsed.walk() if p.get_filename() == 'blob.bin')
+
+    target = tmp_path / 'blob.bin'
+    written = EmailProcessor._write_attachment_content(part, str(target))
+    assert written == len(data)
+    assert target.read_bytes() == data == part.get_payload(decode=True)
+
+
+def test_streamed_quoted_printable_matches_in_memory_decode(tmp_path, monkeypatch):
+    import src.core.email_processor as ep
+    monkeypatch.setattr(ep, 'ATTACHMENT_CHUNK_SIZE', 100)
+
+    text = ('Grüße, café = 100% ' * 40 + '\n') * 20 + 'x' * 500
+    msg = EmailMessage()
+    msg.set_content('see attachment')
+    msg.add_attachment(text.encode('utf-8'), maintype='text', subtype='plain',
+                       filename='notes.txt', cte='quoted-printable')
+
+    parsed = EmailProcessor().parse_email(msg.as_bytes())
+    part = next(p for p in parsed.walk() if p.get_filename() == 'notes.txt')
+
+    target = tmp_path / 'notes.txt'
+    written = EmailProcessor._write_attachment_content(part, str(target))
+    assert target.read_bytes() == part.get_payload(decode=True) == text.encode('utf-8')
+    assert written == len(target.read_bytes())
+
+
+def test_write_attachment_content_falls_back_on_bad_base64(tmp_path):
+    msg = EmailMessage()
+    msg['Content-Type'] = 'application/octet-stream'
+    msg['Content-Transfer-Encoding'] = 'base64'
+    msg.set_payload('QUJD\nR')  # dangling character cannot be decoded in slices
+
+    target = tmp_path / 'out.bin'
+    written = EmailProcessor._write_attachment_content(msg, str(target))
+    assert target.read_bytes() == msg.get_payload(decode=True)
+    assert written == len(target.read_bytes())
+
+
+def test_parse_email_headers_match_default_policy():
+    raw = (
+        "From: =?utf-8?q?J=C3=BCrgen?= <j@example.com>\r\n"
+        "Subject: Grüße, folded\r\n  =?utf-8?b?w6TDtsO8?=\r\n"
+        "Content-Type: multipart/mixed; boundary=XX\r\n\r\n"
+        "--XX\r\nContent-Type: application/pdf\r\n"
+        "Content-Disposition: attachment; filename=\"=?utf-8?q?B=C3=A4r.pdf?=\"\r\n\r\nx\r\n"
+        "--XX--\r\n"
+    ).encode('utf-8')
+
+    msg = EmailProcessor().parse_email(raw)
+    assert EmailProcessor._decode_mime_string(msg.get('From')) == 'Jürgen <j@example.com>'
+    assert EmailProcessor._decode_mime_string(msg.get('Subject')) == 'Grüße, folded  äöü'
+    names = [EmailProcessor._decode_mime_string(p.get_filename())
+             for p in msg.walk() if EmailProcessor._is_attachment(p)]
+    assert names == ['Bär.pdf']
+
+
+def test_prepare_directory_structure_memoizes_parent(tmp_path):
+    proc = EmailProcessor()
+    base = str(tmp_path)
+    info1 = {'sender_email': 'a:b@example.com', 'date_for_filename': '2024-01-15',
+             'email_folder_name': 'f1'}
+    info2 = dict(info1, email_folder_name='f2')
+
+    d1 = proc._prepare_directory_structure(base, info1, True, True)
+    d2 = proc._prepare_directory_structure(base, info2, True, True)
+    assert d1 == os.path.join(base, 'a_b@example.com', '2024-01-15', 'f1')
+    assert os.path.dirname(d1) == os.path.dirname(d2)
+    assert len(proc._parent_dir_cache) == 1
+
+    # Unorganized layout goes straight under the base path
+    assert proc._prepare_directory_structure(base, info1, False, False) == os.path.join(base, 'f1')
+
+
+def test_write_attachment_content_keeps_8bit_bytes(tmp_path):
+    raw = (
+        b'MIME-Version: 1.0\r\nContent-Type: multipart/mixed; boundary="b"\r\n\r\n'
+        b'--b\r\nContent-Type: text/csv; charset=latin-1\r\n'
+        b'Content-Disposition: attachment; filename="a.csv"\r\n'
+        b'Content-Transfer-Encoding: 8bit\r\n\r\nname;city\r\nJ\xfcrgen;K\xf6ln\r\n--b--\r\n'
+    )
+    part = EmailProcessor().parse_email(raw, 'imap.example.com').get_payload()[0]
+    target = tmp_path / 'a.csv'
+    written = EmailProcessor._write_attachment_content(part, str(target))
+    assert target.read_bytes() == part.get_payload(decode=True)
+    assert written == len(target.read_bytes())
+
+
+def test_is_attachment_header_peek_matches_full_check():
+    headers = [
+        {},
+        {'Content-Type': 'text/plain; charset=utf-8'},
+        {'Content-Type': 'text/html', 'Content-Disposition': 'inline'},
+        {'Content-Type': 'image/png; name="logo.png"', 'Content-Disposition': 'inline'},
+        {'Content-Type': 'application/pdf', 'Content-Disposition': 'attachment'},
+        {'Content-Type': 'application/pdf', 'Content-Disposition': "inline; filename*=utf-8''r%C3%A9.pdf"},
+        {'Content-Type': 'application/octet-stream; NAME=data.bin'},
+    ]
+    for fields in headers:
+        part = EmailMessage()
+        for key, value in fields.items():
+            part[key] = value
+        expected = part.get_content_disposition() == 'attachment' or part.get_filename() is not None
+        assert EmailProcessor._is_attachment(part) is expected, fields
+
+
+def test_deduplicate_hard_links_identical_attachments(tmp_path):
+    import hashlib
+
+    proc = EmailProcessor()
+    saved = []
+    for eid, subject in (('1', 'First'), ('2', 'Second')):
+        msg = EmailMessage()
+        msg['From'] = 'Alice <alice@example.com>'
+        msg['Subject'] = subject
+        msg.set_content('Body here')
+        msg.add_attachment(b'LOGO' * 20000, maintype='image', subtype='png', filename='logo.png')
+        msg.add_attachment(b'ICON' * 100, maintype='image', subtype='png', filename='icon.png')
+        saved += proc.extract_attachments(
+            email_id=eid, msg=msg, save_path=str(tmp_path), deduplicate=True
+        )
+
+    first, first_icon, second, second_icon = saved
+    assert first['sha256'] == second['sha256'] == hashlib.sha256(b'LOGO' * 20000).hexdigest()
+    assert first['linked_to'] is None
+    assert second['linked_to'] == first['filepath']
+    assert os.path.samefile(first['filepath'], second['filepath'])
+
+    # Below DEDUP_MIN_SIZE identical files are kept as separate copies
+    assert first_icon['sha256'] == second_icon['sha256']
+    assert second_icon['linked_to'] is None
+    assert not os.path.samefile(first_icon['filepath'], second_icon['filepath'])
+
+
+def test_write_attachment_content_digest_restarts_on_fallback(tmp_path):
+    import hashlib
+    from src.core.email_processor import _ContentDigest
+
+    msg = EmailMessage()
+    msg['Content-Type'] = 'application/octet-stream'
+    msg['Content-Transfer-Encoding'] = 'base64'
+    msg.set_payload('QUJD\nR')
+
+    digest = _ContentDigest()
+    EmailProcessor._write_attachment_content(msg, str(tmp_path / 'out.bin'), digest)
+    assert digest.hexdigest() == hashlib.sha256((tmp_path / 'out.bin').read_bytes()).hexdigest()
+
+
+def test_iter_leaf_parts_matches_walk_order():
+    inner = EmailMessage()
+    inner['Subject'] = 'forwarded'
+    inner.set_content('inner body')
+    inner.add_attachment(b'inner', maintype='application', subtype='octet-stream', filename='in.bin')
+
+    msg = EmailMessage()
+    msg.set_content('body')
+    msg.add_alternative('<p>body</p>', subtype='html')
+    msg.add_attachment(b'one', maintype='application', subtype='pdf', filename='a.pdf')
+    msg.add_attachment(inner)
+    msg.add_attachment('x,y\n', subtype='csv', filename='b.csv')
+    msg = email.message_from_bytes(msg.as_bytes())
+
+    leaves = [p for p in msg.walk() if not p.is_multipart()]
+    assert list(EmailProcessor._iter_leaf_parts(msg)) == leaves
+
+
+def test_headers_only_parse_keeps_attachment_results(tmp_path):
+    plain = EmailMessage()
+    plain['From'] = 'Alice <alice@example.com>'
+    plain['Subject'] = 'Lunch'
+    plain.set_content('<input name=x> see you at noon')
+    plain.add_alternative('<p>see you</p>', subtype='html')
+
+    attached = EmailMessage()
+    attached['From'] = 'Alice <alice@example.com>'
+    attached.set_content('report attached')
+    attached.add_attachment(b'data', maintype='application', subtype='pdf',
+                            filename='Bericht für März.pdf')  # RFC 2231 filename*=
+
+    proc = EmailProcessor()
+    for msg, headers_only in ((plain, True), (attached, False)):
+        raw = msg.as_bytes()
+        quick = proc.parse_email(raw, headers_only_if_plain=True)
+        assert (not quick.is_multipart()) is headers_only
+        assert quick['Subject'] == msg['Subject']
+        full = proc.parse_email(raw)
+        assert ([a['original_filename'] for a in proc._collect_attachments(quick, None, None, PatternMatcher())]
+                == [a['original_filename'] for a in proc._collect_attachments(full, None, None, PatternMatcher())])
+
+
+def test_write_buffer_size_follows_payload():
+    import io
+    from src.core.email_processor import ATTACHMENT_WRITE_BUFFER
+
+    assert EmailProcessor._write_buffer_size('QUJD') == io.DEFAULT_BUFFER_SIZE
+    assert EmailProcessor._write_buffer_size('A' * 100_000) == 100_000
+    assert EmailProcessor._write_buffer_size('A' * (3 << 20)) == ATTACHMENT_WRITE_BUFFER
+
+
+def test_folder_name_only_built_when_saving(tmp_path, monkeypatch):
+    import src.core.email_processor as ep
+
+    calls = []
+    real = ep.sanitize_filename
+    monkeypatch.setattr(ep, 'sanitize_filename', lambda name: calls.append(name) or real(name))
+
+    msg = EmailMessage()
+    msg['From'] = 'Alice <alice@example.com>'
+    msg['Subject'] = 'No files here'
+    msg.set_content('just text')
+
+    proc = EmailProcessor()
+    assert proc.extract_attachments(email_id='1', msg=msg, save_path=str(tmp_path)) == []
+    assert calls == []
+    assert 'email_folder_name' not in proc.current_email_info
+
+
+def test_patterns_printed_once(capsys):
+    proc = EmailProcessor()
+    msg = EmailMessage()
+    msg.set_content('text')
+    for _ in range(3):
+        proc._collect_attachments(msg, ['pdf'], ['exe'], PatternMatcher())
+    out = capsys.readouterr().out
+    assert out.count('Allowed patterns') == 1
+    assert out.count('Excluded patterns') == 1
+
+    proc._collect_attachments(msg, ['png'], None, PatternMatcher())
+    assert capsys.readouterr().out.count('Allowed patterns') == 1
+
+
+def test_save_never_overwrites_file_missing_from_listing(tmp_path, monkeypatch):
+    import src.core.email_processor as email_processor
+
+    msg = EmailMessage()
+    msg['From'] = 'a@example.com'
+    msg['Subject'] = 'Report'
+    msg['Message-ID'] = '<abc@example.com>'
+    msg['Date'] = 'Fri, 21 Nov 1997 09:55:06 -0600'
+    msg.set_content('Body')
+    msg.add_attachment(b'PDFDATA', maintype='application', subtype='pdf', filename='report.pdf')
+
+    first = EmailProcessor().extract_attachments(email_id='1', msg=msg, save_path=str(tmp_path))
+    with open(first[0]['filepath'], 'wb') as f:
+        f.write(b'OTHER')
+
+    # Another parse worker listed the folder before that file was written
+    monkeypatch.setattr(email_processor, 'get_existing_filenames', lambda directory: set())
+    second = EmailProcessor().extract_attachments(email_id='1', msg=msg, save_path=str(tmp_path))
+    assert second[0]['filename'] == '01_report_1.pdf'
+    with open(first[0]['filepath'], 'rb') as f:
+        assert f.read() == b'OTHER'
+    with open(second[0]['filepath'], 'rb') as f:
+        assert f.read() == b'PDFDATA'
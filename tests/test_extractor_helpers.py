@@ -11,6 +11,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.extractor import EmailAttachmentExtractor
+from src.core.seen_state import SeenMessages
 
 
 def make_extractor():
@@ -50,3 +51,523 @@ def test_calculate_effective_limit():
     # Remaining total smaller than per-folder
     assert ext._calculate_effective_limit(4, 10, 9) == 1
 
+
+
+class _FakeImap:
+    """Minimal IMAP stub recording FETCH commands."""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.fetch_calls = []
+
+    @staticmethod
+    def expand(message_set):
+        ids = []
+        for item in message_set.split(','):
+            first, _, last = item.partition(':')
+            ids.extend(str(i) for i in range(int(first), int(last or first) + 1))
+        return ids
+
+    def fetch(self, message_set, spec):
+        self.fetch_calls.append((message_set, spec))
+        data = []
+        for eid in self.expand(message_set):
+            if eid in self.messages:
+                raw = self.messages[eid]
+                data.append((f'{eid} (BODY[] {{{len(raw)}}}'.encode(), raw))
+                data.append(b')')
+        return 'OK', data
+
+
+def test_fetch_emails_bulk_single_round_trip():
+    ext = make_extractor()
+    ext.imap = _FakeImap({'1': b'raw-1', '2': b'raw-2', '10': b'raw-10'})
+    fetched = ext._fetch_emails_bulk(['1', '2', '10', '11'])
+    assert fetched == {'1': b'raw-1', '2': b'raw-2', '10': b'raw-10'}
+    assert ext.imap.fetch_calls == [('1:2,10:11', '(BODY.PEEK[])')]
+
+
+def test_process_emails_batches_fetch(tmp_path, monkeypatch):
+    ext = make_extractor()
+    ids = [str(i) for i in range(1, 6)]
+    ext.imap = _FakeImap({eid: b'Subject: hi\r\n\r\nbody' for eid in ids})
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ids)
+    monkeypatch.setattr(EmailAttachmentExtractor, 'BULK_FETCH_SIZE', 2)
+
+    stats = ext.process_emails(save_path=str(tmp_path), save_metadata=False)
+    assert stats['emails_processed'] == 5
+    body_fetches = [c[0] for c in ext.imap.fetch_calls if c[1] != '(BODYSTRUCTURE)']
+    assert body_fetches == ['1:2', '3:4', '5']
+
+
+def test_process_all_inbox_folders_parallel_workers(tmp_path, monkeypatch):
+    ext = make_extractor()
+    folders = ['INBOX', 'INBOX/A', 'INBOX/B']
+    monkeypatch.setattr(ext, 'get_mailboxes', lambda: folders)
+    monkeypatch.setattr(EmailAttachmentExtractor, 'connect', lambda self: True)
+    monkeypatch.setattr(EmailAttachmentExtractor, 'disconnect', lambda self: None)
+
+    seen = []
+
+    def fake_process_mailbox(self, mailbox, save_path, processed_count, **kwargs):
+        assert self is not ext  # each folder runs on its own connection
+        with self._stats_lock:
+            seen.append(mailbox)
+            self.statistics['emails_processed'] += 1
+        return processed_count + 1
+
+    monkeypatch.setattr(EmailAttachmentExtractor, '_process_mailbox', fake_process_mailbox)
+
+    stats = ext.process_all_inbox_folders(
+        save_path=str(tmp_path), save_metadata=False, folder_workers=3
+    )
+    assert sorted(seen) == sorted(folders)
+    assert stats['emails_processed'] == 3
+
+
+def test_process_emails_pipeline_falls_back_to_single_fetch(tmp_path, monkeypatch):
+    class BulkFailingImap(_FakeImap):
+        def fetch(self, message_set, spec):
+            if len(self.expand(message_set)) > 1:
+                self.fetch_calls.append((message_set, spec))
+                return 'NO', [None]
+            return super().fetch(message_set, spec)
+
+    ext = make_extractor()
+    ids = ['1', '2', '3']
+    ext.imap = BulkFailingImap({eid: b'Subject: hi\r\n\r\nbody' for eid in ids})
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ids)
+
+    stats = ext.process_emails(save_path=str(tmp_path), save_metadata=False)
+    assert stats['emails_processed'] == 3
+    body_fetches = [c[0] for c in ext.imap.fetch_calls if c[1] != '(BODYSTRUCTURE)']
+    assert body_fetches == ['1:3', '1', '2', '3']
+
+
+def test_parallel_folders_reuse_worker_connections(tmp_path, monkeypatch):
+    ext = make_extractor()
+    folders = ['INBOX'] + [f'INBOX/F{i}' for i in range(7)]
+    monkeypatch.setattr(ext, 'get_mailboxes', lambda: folders)
+    logins = []
+    monkeypatch.setattr(EmailAttachmentExtractor, 'connect', lambda self: logins.append(self) or True)
+    monkeypatch.setattr(EmailAttachmentExtractor, 'disconnect', lambda self: None)
+    monkeypatch.setattr(
+        EmailAttachmentExtractor, '_process_mailbox',
+        lambda self, mailbox, save_path, processed_count, **kw: processed_count
+    )
+
+    ext.process_all_inbox_folders(save_path=str(tmp_path), save_metadata=False, folder_workers=2)
+    # One login per worker thread, not per folder
+    assert 1 <= len(logins) <= 2
+
+
+_PLAIN_STRUCTURE = b'("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 4 1 NIL NIL NIL NIL)'
+_ATTACHMENT_STRUCTURE = (
+    b'(("TEXT" "PLAIN" NIL NIL NIL "7BIT" 4 1 NIL NIL NIL NIL)'
+    b'("APPLICATION" "PDF" ("NAME" "a.pdf") NIL NIL "BASE64" 8 NIL'
+    b' ("ATTACHMENT" ("FILENAME" "a.pdf")) NIL NIL) "MIXED" ("BOUNDARY" "b") NIL NIL NIL)'
+)
+
+
+class _ProbingImap(_FakeImap):
+    """IMAP stub that also answers BODYSTRUCTURE probes."""
+
+    def __init__(self, messages, structures):
+        super().__init__(messages)
+        self.structures = structures
+
+    def fetch(self, message_set, spec):
+        if spec != '(BODYSTRUCTURE)':
+            return super().fetch(message_set, spec)
+        self.fetch_calls.append((message_set, spec))
+        return 'OK', [
+            f'{eid} (BODYSTRUCTURE '.encode() + self.structures[eid] + b')'
+            for eid in self.expand(message_set)
+        ]
+
+
+def test_process_emails_skips_messages_without_attachments(tmp_path, monkeypatch):
+    structures = {'1': _PLAIN_STRUCTURE, '2': _ATTACHMENT_STRUCTURE}
+
+    ext = make_extractor()
+    ids = ['1', '2']
+    ext.imap = _ProbingImap({eid: b'Subject: hi\r\n\r\nbody' for eid in ids}, structures)
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ids)
+
+    stats = ext.process_emails(save_path=str(tmp_path), save_metadata=False)
+    assert stats['emails_processed'] == 2
+    assert ext.imap.fetch_calls == [('1:2', '(BODYSTRUCTURE)'), ('2', '(BODY.PEEK[])')]
+
+
+def test_attachment_search_criteria_per_provider():
+    ext = make_extractor()
+    assert ext._attachment_search_criteria('UNSEEN') == 'UNSEEN HEADER Content-Type "multipart/mixed"'
+
+    gmail = EmailAttachmentExtractor(
+        server='imap.gmail.com', port=993, username='u', password='p', use_ssl=True
+    )
+    assert gmail._attachment_search_criteria('ALL') == 'ALL X-GM-RAW "has:attachment"'
+
+
+def _message_with_attachment():
+    return (
+        b'From: a@example.com\r\nSubject: report\r\nMIME-Version: 1.0\r\n'
+        b'Content-Type: multipart/mixed; boundary="b"\r\n\r\n'
+        b'--b\r\nContent-Type: text/plain\r\n\r\nhi\r\n'
+        b'--b\r\nContent-Type: application/pdf\r\n'
+        b'Content-Disposition: attachment; filename="r.pdf"\r\n'
+        b'Content-Transfer-Encoding: base64\r\n\r\nJVBERg==\r\n--b--\r\n'
+    )
+
+
+def test_process_emails_appends_metadata_lines(tmp_path, monkeypatch):
+    import json
+
+    ext = make_extractor()
+    ids = ['1', '2']
+    ext.imap = _FakeImap({eid: _message_with_attachment() for eid in ids})
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ids)
+
+    ext.process_emails(save_path=str(tmp_path))
+    lines = (tmp_path / 'attachments_metadata.jsonl').read_text(encoding='utf-8').splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [r['email_id'] for r in records] == ['1', '2']
+    assert all(r['original_filename'] == 'r.pdf' for r in records)
+    assert not (tmp_path / 'attachments_metadata.json').exists()
+
+
+def test_process_emails_json_pretty_writes_single_file(tmp_path, monkeypatch):
+    import json
+
+    ext = make_extractor()
+    ext.imap = _FakeImap({'1': _message_with_attachment()})
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ['1'])
+
+    ext.process_emails(save_path=str(tmp_path), json_pretty=True)
+    data = json.loads((tmp_path / 'attachments_metadata.json').read_text(encoding='utf-8'))
+    assert len(data['attachments']) == 1
+    assert not (tmp_path / 'attachments_metadata.jsonl').exists()
+
+
+def test_process_emails_with_parse_workers(tmp_path, monkeypatch, capsys):
+    import json
+
+    ext = make_extractor()
+    ids = ['1', '2', '3']
+    ext.imap = _FakeImap({eid: _message_with_attachment() for eid in ids})
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ids)
+    monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+
+    stats = ext.process_emails(save_path=str(tmp_path), parse_workers=2)
+    assert stats['emails_processed'] == 3
+    assert stats['attachments_saved'] == 3
+    lines = (tmp_path / 'attachments_metadata.jsonl').read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['email_id'] for line in lines] == ids
+    # Worker output is relayed by the main process in order
+    out = capsys.readouterr().out
+    assert out.index('ID 1') < out.index('ID 2') < out.index('ID 3')
+
+
+def test_total_limit_prefetches_next_folder_on_standby(tmp_path, monkeypatch):
+    ext = make_extractor()
+    folders = ['INBOX', 'INBOX/A', 'INBOX/B', 'INBOX/C']
+    monkeypatch.setattr(ext, 'get_mailboxes', lambda: folders)
+    monkeypatch.setattr(EmailAttachmentExtractor, 'connect', lambda self: True)
+    monkeypatch.setattr(EmailAttachmentExtractor, 'disconnect', lambda self: None)
+
+    searched = []
+    processed = []
+
+    def fake_select_and_search(self, mailbox, search_criteria, attachments_only):
+        searched.append((self, mailbox))
+        return [f'{mailbox}-{i}' for i in range(3)]
+
+    def fake_process_emails(self, save_path, email_ids=None, limit=None, **kwargs):
+        ids = email_ids[:limit] if limit is not None else email_ids
+        processed.append((self, ids))
+        with self._stats_lock:
+            self.statistics['emails_processed'] += len(ids)
+        return {'emails_processed': len(ids)}
+
+    monkeypatch.setattr(EmailAttachmentExtractor, '_select_and_search', fake_select_and_search)
+    monkeypatch.setattr(EmailAttachmentExtractor, 'process_emails', fake_process_emails)
+
+    ext.process_all_inbox_folders(
+        save_path=str(tmp_path), save_metadata=False, total_limit=5, folder_workers=2
+    )
+    # Folders alternate between the main and the standby connection
+    assert processed[0][0] is ext and processed[1][0] is not ext
+    assert all(conn is searched_conn for (conn, _), (searched_conn, _) in zip(processed, searched))
+    assert processed[0][1] == ['INBOX-0', 'INBOX-1', 'INBOX-2']
+    assert processed[1][1] == ['INBOX/A-0', 'INBOX/A-1']
+
+
+def test_message_set_collapses_consecutive_ids():
+    from src.core.extractor import _message_set
+    assert _message_set(['1', '2', '3', '7', '9', '10']) == '1:3,7,9:10'
+    assert _message_set(['5']) == '5'
+    assert _message_set(['3', '2']) == '3,2'
+
+
+def test_process_emails_bulk_size(tmp_path, monkeypatch):
+    ext = make_extractor()
+    ids = [str(i) for i in range(1, 6)]
+    ext.imap = _FakeImap({eid: b'Subject: hi\r\n\r\nbody' for eid in ids})
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ids)
+
+    ext.process_emails(save_path=str(tmp_path), save_metadata=False, bulk_size=3)
+    body_fetches = [c[0] for c in ext.imap.fetch_calls if c[1] != '(BODYSTRUCTURE)']
+    assert body_fetches == ['1:3', '4:5']
+
+
+def test_probe_covers_several_body_batches(tmp_path, monkeypatch):
+    ids = [str(i) for i in range(1, 6)]
+    structures = {eid: _ATTACHMENT_STRUCTURE for eid in ids}
+    structures['1'] = structures['3'] = _PLAIN_STRUCTURE
+    ext = make_extractor()
+    ext.imap = _ProbingImap({eid: b'Subject: hi\r\n\r\nbody' for eid in ids}, structures)
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ids)
+
+    stats = ext.process_emails(save_path=str(tmp_path), save_metadata=False, bulk_size=2)
+    assert stats['emails_processed'] == 5
+    # One probe for all messages; body batches hold candidates only
+    assert ext.imap.fetch_calls == [
+        ('1:5', '(BODYSTRUCTURE)'), ('2,4', '(BODY.PEEK[])'), ('5', '(BODY.PEEK[])')
+    ]
+
+
+def test_get_mailboxes_lists_once_per_session():
+    class ListingImap:
+        def __init__(self):
+            self.calls = 0
+
+        def list(self, directory='""', pattern='*'):
+            self.calls += 1
+            return 'OK', [b'(\\HasChildren) "/" "INBOX"', b'(\\HasNoChildren) "/" "INBOX/Sub"']
+
+    ext = make_extractor()
+    ext.imap = ListingImap()
+    assert ext.get_mailboxes() == ['INBOX', 'INBOX/Sub']
+    assert ext.get_mailboxes() == ['INBOX', 'INBOX/Sub']
+    assert ext.imap.calls == 1
+    ext.get_mailboxes(refresh=True)
+    assert ext.imap.calls == 2
+
+
+class _UidImap(_FakeImap):
+    """IMAP stub that also answers FETCH (UID); message n has UID 100 + n."""
+
+    def fetch(self, message_set, spec):
+        if spec != '(UID)':
+            return super().fetch(message_set, spec)
+        self.fetch_calls.append((message_set, spec))
+        return 'OK', [f'{eid} (UID {100 + int(eid)})'.encode() for eid in self.expand(message_set)]
+
+
+def test_incremental_run_skips_messages_seen_before(tmp_path, monkeypatch):
+    ids = ['1', '2', '3']
+    ext = make_extractor()
+    ext.PROBE_BODYSTRUCTURE = False
+    ext.imap = _UidImap({eid: b'Subject: hi\r\n\r\nbody' for eid in ids})
+    ext._selected_mailbox, ext._uidvalidity = 'INBOX', 7
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ids[:2])
+
+    ext.process_emails(save_path=str(tmp_path), save_metadata=False, incremental=True)
+    assert ('1:2', '(BODY.PEEK[])') in ext.imap.fetch_calls
+
+    # A new message arrived; only it is downloaded
+    ext.imap.fetch_calls.clear()
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ids)
+    ext.process_emails(save_path=str(tmp_path), save_metadata=False, incremental=True)
+    assert ext.imap.fetch_calls == [('1:3', '(UID)'), ('3', '(BODY.PEEK[])')]
+
+    # A new UIDVALIDITY invalidates the recorded UIDs
+    ext.imap.fetch_calls.clear()
+    ext._uidvalidity = 8
+    ext.process_emails(save_path=str(tmp_path), save_metadata=False, incremental=True)
+    assert ('1:3', '(BODY.PEEK[])') in ext.imap.fetch_calls
+
+
+def test_incremental_limit_applies_to_unseen_messages(tmp_path, monkeypatch):
+    ids = [str(i) for i in range(1, 7)]
+    seen = SeenMessages(str(tmp_path), 'INBOX', 7)
+    seen.add('101')
+    seen.add('102')
+    seen.close()
+
+    ext = make_extractor()
+    ext.PROBE_BODYSTRUCTURE = False
+    ext.imap = _UidImap({eid: b'Subject: hi\r\n\r\nbody' for eid in ids})
+    ext._selected_mailbox, ext._uidvalidity = 'INBOX', 7
+    monkeypatch.setattr(
+        ext, 'search_emails',
+        lambda criteria, limit, attachments_only=False: ids if limit is None else ids[:limit]
+    )
+
+    stats = ext.process_emails(save_path=str(tmp_path), save_metadata=False, limit=2, incremental=True)
+    assert stats['emails_processed'] == 2
+    assert ('3:4', '(BODY.PEEK[])') in ext.imap.fetch_calls
+
+
+def test_incremental_filtered_run_records_nothing(tmp_path, monkeypatch):
+    class UidProbingImap(_UidImap, _ProbingImap):
+        pass
+
+    ids = ['1', '2']
+    ext = make_extractor()
+    ext.imap = UidProbingImap(
+        {eid: b'Subject: hi\r\n\r\nbody' for eid in ids},
+        {'1': _ATTACHMENT_STRUCTURE, '2': _ATTACHMENT_STRUCTURE}
+    )
+    ext._selected_mailbox, ext._uidvalidity = 'INBOX', 7
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ids)
+
+    # The probe rejects both messages because of the pattern alone
+    ext.process_emails(
+        save_path=str(tmp_path), save_metadata=False, incremental=True,
+        allowed_extensions=['*.docx']
+    )
+    assert len(SeenMessages(str(tmp_path), 'INBOX', 7)) == 0
+
+    ext.process_emails(save_path=str(tmp_path), save_metadata=False, incremental=True)
+    assert ('1:2', '(BODY.PEEK[])') in ext.imap.fetch_calls
+    assert len(SeenMessages(str(tmp_path), 'INBOX', 7)) == 2
+
+
+def test_incremental_run_does_not_remember_failed_saves(tmp_path, monkeypatch):
+    import errno
+    from src.core.email_processor import EmailProcessor
+
+    def full_disk(cls, part, filepath, digest=None):
+        raise OSError(errno.ENOSPC, 'No space left on device')
+
+    ext = make_extractor()
+    ext.PROBE_BODYSTRUCTURE = False
+    ext.imap = _UidImap({'1': _message_with_attachment()})
+    ext._selected_mailbox, ext._uidvalidity = 'INBOX', 7
+    monkeypatch.setattr(ext, 'search_emails', lambda criteria, limit, attachments_only=False: ['1'])
+
+    with monkeypatch.context() as m:
+        m.setattr(EmailProcessor, '_write_attachment_content', classmethod(full_disk))
+        stats = ext.process_emails(save_path=str(tmp_path), save_metadata=False, incremental=True)
+    assert stats['attachments_saved'] == 0
+    assert any('No space left' in err for err in stats['errors'])
+    assert len(SeenMessages(str(tmp_path), 'INBOX', 7)) == 0
+
+    # The next run retries the message and remembers it once saved
+    stats = ext.process_emails(save_path=str(tmp_path), save_metadata=False, incremental=True)
+    assert stats['attachments_saved'] == 1
+    assert '101' in SeenMessages(str(tmp_path), 'INBOX', 7)
+
+
+def test_fetch_uids_in_windows(monkeypatch):
+    class FlakyUidImap(_UidImap):
+        def fetch(self, message_set, spec):
+            if message_set == '3:4':
+                self.fetch_calls.append((message_set, spec))
+                return 'NO', [None]
+            return super().fetch(message_set, spec)
+
+    ext = make_extractor()
+    ext.imap = FlakyUidImap({})
+    monkeypatch.setattr(EmailAttachmentExtractor, 'PROBE_BATCH_SIZE', 2)
+
+    uids = ext._fetch_uids(['1', '2', '3', '4', '5'])
+    assert ext.imap.fetch_calls == [('1:2', '(UID)'), ('3:4', '(UID)'), ('5', '(UID)')]
+    assert uids == {'1': '101', '2': '102', '5': '105'}
+
+    ext.imap.fetch_calls.clear()
+    assert ext._fetch_uids(['3', '4']) is None
+
+
+def test_filter_inbox_folders_uses_listed_delimiter():
+    class DotImap:
+        def list(self, directory='""', pattern='*'):
+            return 'OK', [
+                b'(\\HasChildren) "." "INBOX"',
+                b'(\\Noselect \\HasChildren) "." "INBOX.Archive"',
+                b'(\\HasNoChildren) "." "INBOX.Archive.2023"',
+                b'(\\HasNoChildren) "." "INBOX.Work"',
+                b'(\\HasNoChildren) "." "Sent"',
+            ]
+
+    ext = make_extractor()
+    ext.imap = DotImap()
+    folders = ext._filter_inbox_folders(ext.get_mailboxes())
+    assert folders == ['INBOX', 'INBOX.Archive.2023', 'INBOX.Work']
+
+
+def test_subscribed_mailboxes_skip_unsubscribed_parents():
+    class LsubImap:
+        def lsub(self, directory='""', pattern='*'):
+            return 'OK', [
+                b'(\\Noselect) "." "INBOX.Archive"',
+                b'() "." "INBOX.Archive.2023"',
+                b'() "." "Sent"',
+            ]
+
+    ext = make_extractor()
+    ext.imap = LsubImap()
+    folders = ext._filter_inbox_folders(ext.get_subscribed_mailboxes())
+    assert folders == ['INBOX', 'INBOX.Archive.2023']
+
+
+def test_errors_beyond_limit_are_only_counted(capsys):
+    ext = make_extractor()
+    ext.MAX_ERRORS_KEPT = 3
+    for i in range(5):
+        ext._add_error(f"error {i}")
+    assert ext.statistics['errors'] == ['error 0', 'error 1', 'error 2']
+    assert ext.statistics['errors_dropped'] == 2
+    ext.print_statistics()
+    assert '5 error(s) occurred' in capsys.readouterr().out
+
+
+def test_search_encodes_non_ascii_criteria_as_utf8():
+    class SearchImap:
+        def __init__(self):
+            self.calls = []
+
+        def search(self, charset, criteria):
+            self.calls.append((charset, criteria))
+            return 'OK', [b'1 2']
+
+    ext = make_extractor()
+    ext.imap = SearchImap()
+    assert ext.search_emails('ALL') == ['1', '2']
+    ext.search_emails('SUBJECT "März"')
+    assert ext.imap.calls == [(None, 'ALL'), ('UTF-8', 'SUBJECT "März"'.encode('utf-8'))]
+
+
+def test_parse_list_item_handles_literal_names():
+    ext = make_extractor()
+    item = (b'(\\HasNoChildren) "/" {12}', b'INBOX/"odd"')
+    assert ext._parse_list_item(item) == (b'\\HasNoChildren', '/', 'INBOX/"odd"')
+    assert ext._parse_list_item(b'') is None
+    assert ext._parse_list_item(b'(\\Noselect) NIL "Shared"') == (b'\\Noselect', None, 'Shared')
+
+
+def test_connections_share_ssl_context_and_disable_nagle():
+    import socket
+
+    assert (EmailAttachmentExtractor._get_ssl_context()
+            is EmailAttachmentExtractor._get_ssl_context())
+
+    class FakeSocket:
+        options = []
+
+        def setsockopt(self, *args):
+            self.options.append(args)
+
+    sock = FakeSocket()
+    EmailAttachmentExtractor._tune_socket(sock)
+    assert sock.options == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+    EmailAttachmentExtractor._tune_socket(None)  # no socket: ignored
+
+
+def test_filename_filter_matches_collect_attachments_rules():
+    assert EmailAttachmentExtractor._filename_filter(None, []) is None
+    accept = EmailAttachmentExtractor._filename_filter(['pdf'], ['*secret*'])
+    assert accept('=?utf-8?q?Bericht_M=C3=A4rz.PDF?=')
+    assert not accept('photo.jpg')
+    assert not accept('top-secret.pdf')
@@ -17,6 +17,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.utils.filesystem import (
     sanitize_filename,
     get_unique_filename,
+    get_existing_filenames,
     create_directory,
     get_file_size_readable,
     check_disk_space,
@@ -55,6 +56,15 @@ class TestSanitizeFilename:
         assert sanitize_filename('COM1') == '_COM1'
         assert sanitize_filename('LPT1.pdf') == '_LPT1.pdf'
     
+    def test_windows_reserved_names_flag(self, monkeypatch):
+        """Reserved-name handling follows the cached platform flag."""
+        import src.utils.filesystem as fs
+        monkeypatch.setattr(fs, '_IS_WINDOWS', True)
+        assert sanitize_filename('nul.txt') == '_nul.txt'
+        assert sanitize_filename('CONSOLE.txt') == 'CONSOLE.txt'
+        monkeypatch.setattr(fs, '_IS_WINDOWS', False)
+        assert sanitize_filename('nul.txt') == 'nul.txt'
+    
     def test_filename_length_limit(self):
         """Test filename length limiting."""
         long_name = 'a' * 300 + '.txt'
@@ -105,6 +115,22 @@ class TestGetUniqueFilename:
             assert filename.endswith('.pdf')
             assert filename == 'document_1.pdf'
 
+    
+    def test_unique_filename_with_existing_names(self):
+        """Test collision checks against a pre-listed name set."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, 'report.pdf').touch()
+            existing = get_existing_filenames(tmpdir)
+            
+            assert get_unique_filename(tmpdir, 'report.pdf', existing) == 'report_1.pdf'
+            # Chosen names are claimed, so the next call moves on
+            assert get_unique_filename(tmpdir, 'report.pdf', existing) == 'report_2.pdf'
+            assert get_unique_filename(tmpdir, 'other.pdf', existing) == 'other.pdf'
+    
+    def test_existing_filenames_missing_directory(self):
+        """Test listing a directory that does not exist."""
+        assert get_existing_filenames('/nonexistent/path') == set()
+
 
 class TestCreateDirectory:
     """Test directory creation."""